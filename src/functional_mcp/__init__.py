@@ -6,9 +6,10 @@ Like mcp2py, but built on FastMCP with tool transformation support.
 
 __version__ = "0.1.0"
 
-from .loader import load, aload
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .registry import register
-from .transformation import ArgTransform, transform_tool
 from .exceptions import (
     MCPConnectionError,
     MCPToolError,
@@ -16,10 +17,44 @@ from .exceptions import (
     MCPValidationError,
 )
 
+# Imported on first access (PEP 562) - the loader pulls in FastMCP
+# and transformation pulls in Pydantic
+_LAZY_ATTRS = {
+    "load": ".loader",
+    "aload": ".loader",
+    "load_servers": ".loader",
+    "aload_servers": ".loader",
+    "load_all": ".loader",
+    "ArgTransform": ".transformation",
+    "transform_tool": ".transformation",
+}
+
+if TYPE_CHECKING:
+    from .loader import load, aload, load_servers, aload_servers, load_all
+    from .transformation import ArgTransform, transform_tool
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Skip __getattr__ on later access
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRS])
+
+
 __all__ = [
     # Core
     "load",
     "aload",
+    "load_servers",
+    "aload_servers",
+    "load_all",
     
     # Registry
     "register",
@@ -0,0 +1,32 @@
+"""
+JSON encoding helpers.
+
+Uses orjson when installed (functional-mcp[speedups]), otherwise
+the standard library json module.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+    
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+    
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to JSON bytes, optionally indented by 2 spaces."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    import json
+    
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
+    
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to JSON bytes, optionally indented by 2 spaces."""
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+__all__ = ["loads", "dumps"]
@@ -4,15 +4,113 @@ Authentication handling for MCP servers.
 Supports Bearer tokens, OAuth flows, and custom auth.
 """
 
-import json
-import webbrowser
+import asyncio
+import importlib.util
+import os
+import re
+import socket
+import time
+import weakref
+from functools import cache
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 import httpx
 
+from . import _json
+from .utils import write_bytes
+
+# Without httpx[http2] installed, pool HTTP/1.1 connections
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 
 _TOKEN_CACHE = Path.home() / ".config" / "functional-mcp" / "tokens.json"
 
+_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# Seconds before expiry at which a cached token is refreshed
+_EXPIRY_MARGIN = 60.0
+
+# Parsed token cache file, shared by all OAuth instances
+_token_memo: dict | None = None
+
+# One connection pool per event loop (pooled sockets are loop-bound)
+_POOLS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Send requests through a shared pool without closing it."""
+    
+    def __init__(self, pool: httpx.AsyncHTTPTransport):
+        self._pool = pool
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool.handle_async_request(request)
+    
+    async def aclose(self) -> None:
+        # The pool outlives the clients that borrow it
+        pass
+
+
+def _shared_pool() -> httpx.AsyncHTTPTransport:
+    """Get the connection pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _POOLS.get(loop)
+    if pool is None:
+        pool = httpx.AsyncHTTPTransport(http2=_HTTP2, limits=_POOL_LIMITS)
+        _POOLS[loop] = pool
+    return pool
+
+
+def create_http_client(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout | None = None,
+    auth: httpx.Auth | None = None,
+    follow_redirects: bool = True,
+    **kwargs: Any,
+) -> httpx.AsyncClient:
+    """
+    Create an httpx client backed by the shared connection pool.
+    
+    Used as the httpx_client_factory of HTTP transports, so servers on
+    the same host reuse TCP/TLS connections instead of handshaking per
+    server. Headers and auth stay per client.
+    
+    Args:
+        headers: Headers sent with every request
+        timeout: Request timeout (30s if None)
+        auth: httpx.Auth instance
+        follow_redirects: Whether to follow redirects
+        **kwargs: Other httpx.AsyncClient options the transport passes
+    
+    Returns:
+        httpx.AsyncClient instance
+    """
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout or httpx.Timeout(30.0),
+        auth=auth,
+        follow_redirects=follow_redirects,
+        transport=_SharedTransport(_shared_pool()),
+        **kwargs,
+    )
+
+
+async def close_http_pool() -> None:
+    """Close the connection pool of the running event loop, if any."""
+    pool = _POOLS.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.aclose()
+
+
+@cache
+def _token_http_client() -> httpx.Client:
+    """Get the process-wide client used for OAuth token requests."""
+    return httpx.Client(limits=_POOL_LIMITS, http2=_HTTP2)
+
 
 class BearerAuth(httpx.Auth):
     """
@@ -62,6 +160,8 @@ class OAuth:
         self.client_id = client_id
         self.scopes = scopes or []
         self._token = None
+        # Tokens are cached per provider, client and scope set
+        self._cache_key = " ".join([auth_url, client_id, *sorted(self.scopes)])
     
     def get_token(self) -> str:
         """Get access token, triggering OAuth flow if needed."""
@@ -75,38 +175,46 @@ class OAuth:
     
     def _load_cached_token(self) -> bool:
         """Load token from cache if valid."""
-        if not _TOKEN_CACHE.exists():
+        entry = _read_token_cache().get(self._cache_key)
+        if not isinstance(entry, dict):
             return False
         
-        try:
-            with open(_TOKEN_CACHE) as f:
-                data = json.load(f)
-            
-            # TODO: Check expiry
-            self._token = data.get("access_token")
-            return self._token is not None
-        except (json.JSONDecodeError, KeyError):
+        # Treat tokens about to expire as expired
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at - _EXPIRY_MARGIN <= time.time():
             return False
+        
+        self._token = entry.get("access_token")
+        return self._token is not None
     
     def _save_token(self, token_data: dict):
         """Save token to cache."""
-        _TOKEN_CACHE.parent.mkdir(parents=True, exist_ok=True)
-        with open(_TOKEN_CACHE, 'w') as f:
-            json.dump(token_data, f)
+        global _token_memo
+        
+        entry = dict(token_data)
+        if "expires_in" in entry:
+            entry["expires_at"] = time.time() + float(entry["expires_in"])
+        
+        tokens = {**_read_token_cache(), self._cache_key: entry}
+        
+        write_bytes(_TOKEN_CACHE, _json.dumps(tokens), mode=0o600)
+        # mode only applies to a new file; tighten an existing one too
+        os.chmod(_TOKEN_CACHE, 0o600)
+        _token_memo = tokens
     
     def _do_oauth_flow(self):
         """Execute OAuth PKCE flow in browser."""
         import secrets
         import hashlib
         import base64
-        from http.server import HTTPServer, BaseHTTPRequestHandler
-        from urllib.parse import urlencode, parse_qs
+        import webbrowser
+        from urllib.parse import urlencode
         
         # Generate PKCE parameters
         code_verifier = secrets.token_urlsafe(64)
         code_challenge = base64.urlsafe_b64encode(
-            hashlib.sha256(code_verifier.encode()).digest()
-        ).decode().rstrip("=")
+            hashlib.sha256(code_verifier.encode("ascii")).digest()
+        ).rstrip(b"=").decode("ascii")
         
         # Build auth URL
         params = {
@@ -120,39 +228,24 @@ class OAuth:
         
         auth_url = f"{self.auth_url}?{urlencode(params)}"
         
-        # Capture authorization code
-        auth_code = None
-        
-        class CallbackHandler(BaseHTTPRequestHandler):
-            def do_GET(self):
-                nonlocal auth_code
-                query = parse_qs(self.path.split("?")[1])
-                auth_code = query.get("code", [None])[0]
-                
-                self.send_response(200)
-                self.send_header("Content-type", "text/html")
-                self.end_headers()
-                self.wfile.write(b"<html><body><h1>Authentication successful! You can close this window.</h1></body></html>")
-            
-            def log_message(self, format, *args):
-                pass  # Silence logs
-        
-        # Start local server
-        server = HTTPServer(("localhost", 8080), CallbackHandler)
+        # Listen before opening the browser so the redirect can't be missed
+        listener = socket.create_server(("localhost", 8080))
         
         # Open browser
         print("🔐 Opening browser for authentication...")
         webbrowser.open(auth_url)
         
         # Wait for callback
-        server.handle_request()
-        server.server_close()
+        try:
+            auth_code = _receive_auth_code(listener)
+        finally:
+            listener.close()
         
         if not auth_code:
             raise ValueError("OAuth flow failed - no authorization code received")
         
         # Exchange code for token
-        token_response = httpx.post(
+        token_response = _token_http_client().post(
             self.token_url,
             data={
                 "grant_type": "authorization_code",
@@ -170,6 +263,78 @@ class OAuth:
         print("✅ Authentication successful!")
 
 
+def _read_token_cache() -> dict:
+    """
+    Read the token cache file once per process.
+    
+    Returns:
+        Parsed token data, or an empty dict if there is none
+    """
+    global _token_memo
+    
+    if _token_memo is None:
+        try:
+            fd = os.open(_TOKEN_CACHE, os.O_RDONLY)
+            try:
+                chunks = []
+                while chunk := os.read(fd, 8192):
+                    chunks.append(chunk)
+            finally:
+                os.close(fd)
+            data = _json.loads(b"".join(chunks))
+        except (OSError, ValueError):
+            # Missing or corrupt cache
+            data = {}
+        # Entries are keyed token dicts; anything else (e.g. the flat
+        # single-token format of older versions) is dropped
+        _token_memo = {
+            key: entry for key, entry in data.items() if isinstance(entry, dict)
+        } if isinstance(data, dict) else {}
+    
+    return _token_memo
+
+
+_CODE_PATTERN = re.compile(rb"[?&]code=([^&\s#]+)")
+
+_CALLBACK_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/html\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+    b"<html><body><h1>Authentication successful! You can close this window.</h1></body></html>"
+)
+
+
+def _receive_auth_code(listener: socket.socket) -> str | None:
+    """
+    Accept the OAuth redirect and extract the authorization code.
+    
+    Reads only the request line and headers of a single connection,
+    which is all the callback needs.
+    
+    Args:
+        listener: Listening socket bound to the redirect port
+    
+    Returns:
+        Authorization code, or None if the redirect carried none
+    """
+    from urllib.parse import unquote
+    
+    conn, _ = listener.accept()
+    with conn:
+        data = b""
+        while b"\r\n\r\n" not in data and len(data) < 65536:
+            chunk = conn.recv(4096)
+            if not chunk:
+                break
+            data += chunk
+        conn.sendall(_CALLBACK_RESPONSE)
+    
+    # Only the request line holds the query string
+    match = _CODE_PATTERN.search(data.split(b"\r\n", 1)[0])
+    return unquote(match.group(1).decode("ascii", "replace")) if match else None
+
+
 def create_auth_handler(
     auth: str | Callable | httpx.Auth,
 ) -> httpx.Auth | None:
@@ -205,5 +370,5 @@ def create_auth_handler(
     return None
 
 
-__all__ = ["BearerAuth", "OAuth", "create_auth_handler"]
+__all__ = ["BearerAuth", "OAuth", "create_auth_handler", "create_http_client", "close_http_pool"]
 
@@ -0,0 +1,141 @@
+"""
+Catalog caching for MCP servers.
+
+Stores the tools, resources and prompts a server advertises so
+later loads of the same command can skip the listing round-trips.
+"""
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Any, TypedDict
+from mcp import types
+from pydantic import TypeAdapter
+
+from .utils import write_bytes
+
+
+_CATALOG_DIR = Path.home() / ".cache" / "functional-mcp" / "catalogs"
+
+
+class _CatalogFile(TypedDict):
+    command: str
+    stamp: int | None
+    server_info: types.Implementation
+    tools: list[types.Tool]
+    resources: list[types.Resource]
+    prompts: list[types.Prompt]
+
+
+# Built once; reused for every save/load
+_CATALOG_ADAPTER = TypeAdapter(_CatalogFile)
+
+
+def get_catalog_cache_path(command: str, headers: dict[str, str] | None = None) -> Path:
+    """
+    Get cache path for a server's catalog.
+    
+    Servers may advertise different tools per credential or tenant,
+    so the headers are part of the key. They are only hashed, never
+    written to the cache.
+    
+    Args:
+        command: Server command
+        headers: HTTP headers the server is loaded with
+    
+    Returns:
+        Path to catalog file in cache
+    """
+    # Hash command (and headers) to create unique filename
+    key = hashlib.sha256(command.encode())
+    for name, value in sorted((headers or {}).items()):
+        key.update(b"\0" + name.encode() + b"\0" + value.encode())
+    return _CATALOG_DIR / f"{key.hexdigest()[:16]}.json"
+
+
+def save_catalog(
+    command: str,
+    capabilities: dict[str, Any],
+    stamp: int | None = None,
+    headers: dict[str, str] | None = None,
+) -> Path:
+    """
+    Save server capabilities to cache.
+    
+    Args:
+        command: Server command
+        capabilities: Dict with server_info, tools, resources and prompts
+        stamp: Version stamp of the server (e.g. its script's mtime_ns)
+        headers: HTTP headers the server was loaded with
+    
+    Returns:
+        Path where catalog was saved
+    """
+    data = _CatalogFile(
+        command=command,
+        stamp=stamp,
+        server_info=capabilities["server_info"],
+        tools=capabilities["tools"],
+        resources=capabilities["resources"],
+        prompts=capabilities["prompts"],
+    )
+    
+    path = get_catalog_cache_path(command, headers)
+    write_bytes(path, _CATALOG_ADAPTER.dump_json(data, by_alias=True))
+    return path
+
+
+def load_catalog(
+    command: str,
+    ttl: float,
+    stamp: int | None = None,
+    headers: dict[str, str] | None = None,
+) -> dict[str, Any] | None:
+    """
+    Load server capabilities from cache.
+    
+    Args:
+        command: Server command
+        ttl: Maximum catalog age in seconds
+        stamp: Version stamp the catalog must have been saved with
+        headers: HTTP headers the server is loaded with
+    
+    Returns:
+        Dict with server_info, tools, resources and prompts,
+        or None if there is no fresh catalog for the command
+    """
+    path = get_catalog_cache_path(command, headers)
+    
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        
+        data = _CATALOG_ADAPTER.validate_json(path.read_bytes())
+    except (OSError, ValueError):
+        # Missing, unreadable or outdated catalog
+        return None
+    
+    # Guard against hash collisions and changed servers
+    if data["command"] != command or data["stamp"] != stamp:
+        return None
+    
+    return {
+        "server_info": data["server_info"],
+        "tools": data["tools"],
+        "resources": data["resources"],
+        "prompts": data["prompts"],
+    }
+
+
+def clear_catalog(command: str, headers: dict[str, str] | None = None) -> None:
+    """
+    Remove a server's catalog from cache.
+    
+    Args:
+        command: Server command
+        headers: HTTP headers the server was loaded with
+    """
+    get_catalog_cache_path(command, headers).unlink(missing_ok=True)
+
+
+__all__ = ["get_catalog_cache_path", "save_catalog", "load_catalog", "clear_catalog"]
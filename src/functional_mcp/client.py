@@ -4,9 +4,176 @@ Core MCP client wrapper.
 Wraps FastMCP Client and manages connection lifecycle.
 """
 
-from typing import Any
+from typing import Any, Awaitable, Callable, Coroutine, NamedTuple, TypeVar
 import asyncio
+import atexit
+import concurrent.futures
+import os
+import sys
+import threading
+import weakref
 from fastmcp.client import Client as FastMCPClient
+from mcp import McpError
+
+from .exceptions import MCPConnectionError
+
+if sys.platform != "win32":
+    try:
+        import uvloop as _uvloop
+    except ImportError:
+        _uvloop = None  # type: ignore[assignment]
+else:
+    _uvloop = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create the event loop for a client's background thread.
+    
+    Uses uvloop when it is installed (functional-mcp[speedups]), which
+    is faster for pipe- and socket-heavy MCP transports. Set
+    FUNCTIONAL_MCP_UVLOOP=0 to use the default asyncio loop instead.
+    """
+    if _uvloop is not None and os.environ.get("FUNCTIONAL_MCP_UVLOOP") != "0":
+        loop: asyncio.AbstractEventLoop = _uvloop.new_event_loop()
+        return loop
+    return asyncio.new_event_loop()
+
+
+class ServerListing(NamedTuple):
+    """Everything a server advertises, from one list_all() call."""
+    
+    tools: list[Any]
+    resources: list[Any]
+    prompts: list[Any]
+    server_info: Any
+
+
+def _optional_listing(result: Any) -> list[Any]:
+    """
+    Unwrap a resources/prompts listing gathered with return_exceptions.
+    
+    A server without the capability answers with an MCP error, which
+    means an empty listing; any other failure is re-raised.
+    """
+    if isinstance(result, McpError):
+        return []
+    if isinstance(result, BaseException):
+        raise result
+    return result or []
+
+
+class _LoopThread:
+    """
+    An event loop running forever on a daemon thread.
+    
+    Coroutines are submitted from any other thread and run on the
+    loop, so state bound to the loop (sessions, pooled sockets)
+    persists between submissions.
+    """
+    
+    def __init__(self) -> None:
+        self.loop = _new_event_loop()
+        # Run tasks inline until they first suspend, so requests that
+        # complete (or fail) immediately skip a scheduling round-trip
+        self.loop.set_task_factory(asyncio.eager_task_factory)
+        self._thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="functional-mcp-loop",
+            daemon=True,
+        )
+        self._thread.start()
+    
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Schedule coroutine on the loop without waiting."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+    
+    def in_loop_thread(self) -> bool:
+        """Whether the caller is running on the loop's own thread."""
+        return threading.current_thread() is self._thread
+    
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run coroutine on the loop and wait for its result."""
+        if self.in_loop_thread():
+            # Blocking here would wait on the loop we are running on
+            coro.close()
+            raise RuntimeError(
+                "Sync MCP calls can't be made from the client's own event loop "
+                "(e.g. inside a sampling or elicitation handler)"
+            )
+        
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+    
+    @property
+    def closed(self) -> bool:
+        return self.loop.is_closed()
+    
+    def stop(self, timeout: float = 0.1, close: bool = True) -> None:
+        """
+        Stop the loop and close it once the thread has exited.
+        
+        Waits at most timeout seconds for the thread. If it is still
+        running (e.g. at interpreter shutdown) the daemon thread is
+        left to the OS and the loop stays open. With close=False the
+        loop is only stopped, never closed.
+        """
+        if self.loop.is_closed():
+            return
+        
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        if close and not self._thread.is_alive():
+            # Frees the loop's selector fd
+            self.loop.close()
+
+
+_shared_loop: _LoopThread | None = None
+_shared_loop_lock = threading.Lock()
+
+# Wrappers that may still hold an open session, closed at exit
+_open_wrappers: "weakref.WeakSet[MCPClientWrapper]" = weakref.WeakSet()
+
+# Seconds each session (and the HTTP pool) gets to shut down at exit
+_EXIT_TIMEOUT = 5.0
+
+
+def _get_shared_loop() -> _LoopThread:
+    """
+    Get the process-wide loop thread, starting it on first use.
+    
+    All clients multiplex their I/O on this one loop, so loading N
+    servers costs one thread instead of N.
+    """
+    global _shared_loop
+    
+    loop_thread = _shared_loop
+    if loop_thread is None or loop_thread.closed:
+        with _shared_loop_lock:
+            if _shared_loop is None or _shared_loop.closed:
+                _shared_loop = _LoopThread()
+            loop_thread = _shared_loop
+    return loop_thread
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+    """
+    Run coroutine on the shared loop thread and wait for its result.
+    
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait before cancelling it (None waits forever)
+    
+    Returns:
+        The coroutine's result
+    """
+    return _get_shared_loop().run(coro, timeout)
 
 
 class MCPClientWrapper:
@@ -14,57 +181,229 @@ class MCPClientWrapper:
     Wrapper around FastMCP Client for sync/async bridge.
     
     Provides both sync and async interfaces to the underlying
-    FastMCP client.
+    FastMCP client. Sessions live on one process-wide event loop
+    running on a background thread, so the client session (stdio
+    subprocess or HTTP connection) stays open across calls.
+    
+    The session is opened on the first request if it isn't already
+    connected, so servers loaded from a cached catalog only spawn
+    when a tool, resource or prompt is actually used.
+    
+    A wrapper can be shared: acquire() takes another reference and
+    close() only shuts down once the last reference is released.
+    
+    If on_connect is set, it is called with no arguments when the
+    session opens and the returned coroutine runs in the background.
     """
     
-    def __init__(self, client: FastMCPClient):
+    def __init__(self, client: FastMCPClient, timeout: float | None = None):
         self.client = client
-        self._loop = None
+        self._timeout = timeout
+        self._connect_lock = asyncio.Lock()
+        self._refs = 1
+        self._refs_lock = threading.Lock()
+        self._closed = False
+        self._loop_thread = _get_shared_loop()
+        self.on_connect: Callable[[], Awaitable[Any]] | None = None
+        self._background: set[asyncio.Task] = set()
+        _open_wrappers.add(self)
     
-    def _get_loop(self):
-        """Get or create event loop."""
-        if self._loop is None or self._loop.is_closed():
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
-        return self._loop
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Schedule coroutine on the background loop without waiting."""
+        return self._loop_thread.submit(coro)
     
-    def run_async(self, coro):
+    def run_async(self, coro: Coroutine[Any, Any, T]) -> T:
         """Run coroutine synchronously."""
-        loop = self._get_loop()
-        return loop.run_until_complete(coro)
+        if self._closed:
+            coro.close()
+            raise RuntimeError("MCP client is closed")
+        return self._loop_thread.run(coro, self._timeout)
+    
+    async def arun(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Await coroutine on the client's loop from async code.
+        
+        Awaited directly when already running on the client's loop;
+        from any other loop the result is awaited without blocking it.
+        """
+        if self._closed:
+            coro.close()
+            raise RuntimeError("MCP client is closed")
+        
+        if self._loop_thread.in_loop_thread():
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+    
+    async def _ensure_connected(self) -> None:
+        """Open the client session if it isn't open yet."""
+        async with self._connect_lock:
+            if not self.client.is_connected():
+                await self.client.__aenter__()
+                if self.on_connect is not None:
+                    # Keep a reference so the task isn't collected mid-run
+                    task = asyncio.ensure_future(self.on_connect())
+                    self._background.add(task)
+                    task.add_done_callback(self._background.discard)
+    
+    async def _request(self, method: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """Connect if needed, then await a client method."""
+        await self._ensure_connected()
+        return await method(*args)
     
     def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
         """Call tool synchronously."""
-        return self.run_async(self.client.call_tool(name, arguments))
+        return self.run_async(self._request(self.client.call_tool, name, arguments))
     
     def read_resource(self, uri: str) -> Any:
         """Read resource synchronously."""
-        return self.run_async(self.client.read_resource(uri))
+        return self.run_async(self._request(self.client.read_resource, uri))
     
     def get_prompt(self, name: str, arguments: dict[str, Any]) -> Any:
         """Get prompt synchronously."""
-        return self.run_async(self.client.get_prompt(name, arguments))
+        return self.run_async(self._request(self.client.get_prompt, name, arguments))
+    
+    async def acall_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        """Call tool from async code without blocking the caller's loop."""
+        return await self.arun(self._request(self.client.call_tool, name, arguments))
+    
+    async def aread_resource(self, uri: str) -> Any:
+        """Read resource from async code without blocking the caller's loop."""
+        return await self.arun(self._request(self.client.read_resource, uri))
+    
+    async def aget_prompt(self, name: str, arguments: dict[str, Any]) -> Any:
+        """Get prompt from async code without blocking the caller's loop."""
+        return await self.arun(self._request(self.client.get_prompt, name, arguments))
     
     def list_tools(self) -> Any:
         """List tools synchronously."""
-        return self.run_async(self.client.list_tools())
+        return self.run_async(self._request(self.client.list_tools))
     
     def list_resources(self) -> Any:
         """List resources synchronously."""
-        return self.run_async(self.client.list_resources())
+        return self.run_async(self._request(self.client.list_resources))
     
     def list_prompts(self) -> Any:
         """List prompts synchronously."""
-        return self.run_async(self.client.list_prompts())
+        return self.run_async(self._request(self.client.list_prompts))
+    
+    async def _list_all(self) -> ServerListing:
+        await self._ensure_connected()
+        # List tools, resources, prompts in one round-trip
+        tools, resources, prompts = await asyncio.gather(
+            self.client.list_tools(),
+            self.client.list_resources(),
+            self.client.list_prompts(),
+            return_exceptions=True,
+        )
+        if isinstance(tools, BaseException):
+            raise tools
+        
+        initialize_result = self.client.initialize_result
+        if initialize_result is None:
+            raise MCPConnectionError("Server did not complete initialization")
+        
+        return ServerListing(
+            tools,
+            _optional_listing(resources),
+            _optional_listing(prompts),
+            initialize_result.serverInfo,
+        )
+    
+    def list_all(self) -> ServerListing:
+        """List tools, resources and prompts concurrently in one loop entry."""
+        return self.run_async(self._list_all())
     
     def initialize(self) -> Any:
-        """Initialize connection synchronously."""
-        return self.run_async(self.client.initialize())
+        """Open the client session synchronously."""
+        self.run_async(self._ensure_connected())
+        return self.client.initialize_result
+    
+    def acquire(self) -> bool:
+        """
+        Take another reference to this wrapper.
+        
+        Returns:
+            False if the wrapper is already closed
+        """
+        with self._refs_lock:
+            if self._refs == 0:
+                return False
+            self._refs += 1
+            return True
+    
+    def _release(self) -> bool:
+        """Release a reference; True if it was the last one."""
+        with self._refs_lock:
+            if self._refs == 0:
+                return False
+            self._refs -= 1
+            return self._refs == 0
+    
+    def close(self) -> None:
+        """Release a reference; close the session on the last one."""
+        # The shared loop (and its HTTP pool) stays up for other clients
+        if self._release():
+            self._disconnect(self._timeout)
+    
+    async def aclose(self) -> None:
+        """Async version of close(), awaited without blocking the caller's loop."""
+        if not self._release():
+            return
+        
+        _open_wrappers.discard(self)
+        try:
+            if not self._loop_thread.closed:
+                await asyncio.wait_for(self.arun(self._exit_session()), self._timeout)
+        finally:
+            self._closed = True
+    
+    async def _exit_session(self) -> None:
+        """Close the session if it is open."""
+        # Waits out a connect still in progress, so it can't reopen
+        # the session after this closed it
+        async with self._connect_lock:
+            if self.client.is_connected():
+                await self.client.__aexit__(None, None, None)
+    
+    def _disconnect(self, timeout: float | None) -> None:
+        """Close the session (if open) and mark the wrapper closed."""
+        _open_wrappers.discard(self)
+        try:
+            if not self._loop_thread.closed:
+                self._loop_thread.run(self._exit_session(), timeout)
+        finally:
+            self._closed = True
+
+
+@atexit.register
+def _close_at_exit() -> None:
+    """
+    Close sessions still open at interpreter exit, then stop the loop.
+    
+    Stdio servers are shut down cleanly instead of being left to
+    notice the closed pipe after the process is gone.
+    """
+    loop_thread = _shared_loop
+    if loop_thread is None or loop_thread.closed:
+        return
+    
+    from .auth import close_http_pool
+    
+    for wrapper in list(_open_wrappers):
+        with wrapper._refs_lock:
+            wrapper._refs = 0
+        try:
+            wrapper._disconnect(_EXIT_TIMEOUT)
+        except Exception:
+            pass  # Best effort; the process is exiting
     
-    def close(self):
-        """Close client and event loop."""
-        if self._loop and not self._loop.is_closed():
-            self._loop.close()
+    try:
+        loop_thread.run(close_http_pool(), _EXIT_TIMEOUT)
+    except Exception:
+        pass
+    # Left open: transports finalized after this still call into it
+    # (StdioTransport.__del__ sets an event bound to the loop)
+    loop_thread.stop(close=False)
 
 
-__all__ = ["MCPClientWrapper"]
+__all__ = ["MCPClientWrapper", "ServerListing", "run_sync"]
@@ -6,7 +6,63 @@ terminal prompts with type-aware formatting.
 """
 
 from typing import Any, Callable
-import json
+import asyncio
+
+from . import _json
+
+
+def _coerce_bool(value: str) -> bool:
+    return value.lower() in ["y", "yes", "true", "1"]
+
+
+def _coerce_int(value: str) -> int | str:
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _coerce_float(value: str) -> float | str:
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _coerce_str(value: str) -> str:
+    return value
+
+
+# Field type → input coercion (anything else stays a string)
+_COERCERS = {
+    "boolean": _coerce_bool,
+    "integer": _coerce_int,
+    "number": _coerce_float,
+}
+
+
+def _compile_fields(properties: dict[str, Any]) -> list[tuple[str, str, Callable]]:
+    """
+    Compute (name, prompt, coercer) for each field of an object schema.
+    
+    Not cached: keying a cache by the schema costs more than this loop.
+    """
+    fields = []
+    for prop_name, prop_schema in properties.items():
+        prop_desc = prop_schema.get("description", "")
+        prompt = f"  {prop_name}"
+        if prop_desc:
+            prompt += f" ({prop_desc})"
+        prompt += ": "
+        
+        coerce = _COERCERS.get(prop_schema.get("type", "string"), _coerce_str)
+        fields.append((prop_name, prompt, coerce))
+    return fields
+
+
+def _read_lines(prompts: list[str]) -> list[str]:
+    """Read one line of input per prompt (blocking)."""
+    return [input(prompt) for prompt in prompts]
 
 
 def create_elicitation_handler() -> Callable:
@@ -17,6 +73,8 @@ def create_elicitation_handler() -> Callable:
         Elicitation handler function
     """
     
+    # input() blocks, so it runs in a worker thread to keep the
+    # client's event loop (and other MCP traffic) responsive
     async def elicitation_handler(
         message: str,
         schema: dict[str, Any],
@@ -38,17 +96,17 @@ def create_elicitation_handler() -> Callable:
         
         # String input
         if schema_type == "string":
-            return input("→ ")
+            return await asyncio.to_thread(input, "→ ")
         
         # Boolean input
         elif schema_type == "boolean":
-            response = input("→ (y/n): ").lower()
+            response = (await asyncio.to_thread(input, "→ (y/n): ")).lower()
             return response in ["y", "yes", "true", "1"]
         
         # Number input
         elif schema_type in ["number", "integer"]:
             try:
-                value = input("→ ")
+                value = await asyncio.to_thread(input, "→ ")
                 return int(value) if schema_type == "integer" else float(value)
             except ValueError:
                 print("Invalid number, using 0")
@@ -57,47 +115,32 @@ def create_elicitation_handler() -> Callable:
         # Object input (JSON)
         elif schema_type == "object":
             properties = schema.get("properties", {})
-            result = {}
+            fields = _compile_fields(properties)
             
+            # Read all fields in a single worker-thread hop
             print("\nEnter values for each field:")
-            for prop_name, prop_schema in properties.items():
-                prop_desc = prop_schema.get("description", "")
-                prompt = f"  {prop_name}"
-                if prop_desc:
-                    prompt += f" ({prop_desc})"
-                prompt += ": "
-                
-                value = input(prompt)
-                
-                # Type conversion
-                prop_type = prop_schema.get("type", "string")
-                if prop_type == "boolean":
-                    result[prop_name] = value.lower() in ["y", "yes", "true", "1"]
-                elif prop_type in ["number", "integer"]:
-                    try:
-                        result[prop_name] = int(value) if prop_type == "integer" else float(value)
-                    except ValueError:
-                        result[prop_name] = value
-                else:
-                    result[prop_name] = value
+            values = await asyncio.to_thread(_read_lines, [prompt for _, prompt, _ in fields])
             
-            return result
+            return {
+                prop_name: coerce(value)
+                for (prop_name, _, coerce), value in zip(fields, values)
+            }
         
         # Array input (JSON)
         elif schema_type == "array":
             try:
-                value = input("→ (JSON array): ")
-                return json.loads(value)
-            except json.JSONDecodeError:
+                value = await asyncio.to_thread(input, "→ (JSON array): ")
+                return _json.loads(value)
+            except ValueError:
                 print("Invalid JSON, returning empty array")
                 return []
         
         # Fallback: JSON input
         else:
             try:
-                value = input("→ (JSON): ")
-                return json.loads(value)
-            except json.JSONDecodeError:
+                value = await asyncio.to_thread(input, "→ (JSON): ")
+                return _json.loads(value)
+            except ValueError:
                 return value
     
     return elicitation_handler
@@ -6,21 +6,434 @@ dynamic Python modules with tools as methods.
 """
 
 import asyncio
-from pathlib import Path
+import concurrent.futures
+import os
+import re
+import shlex
+import shutil
+import threading
+import weakref
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import Any, Callable
 from fastmcp.client import Client
-from fastmcp.client.transports import (
-    StdioTransport,
-    StreamableHttpTransport,
-    PythonStdioTransport,
-    NpxStdioTransport,
-)
 
+from .auth import create_http_client
+from .client import MCPClientWrapper
+from .catalog import load_catalog, save_catalog
 from .server import create_server_class
-from .registry import get_server_command
+from .registry import get_server_command, list_servers
 from .exceptions import MCPConnectionError
-from .sampling import create_sampling_handler
-from .elicitation import create_elicitation_handler
+
+
+# Cached catalogs are reused for an hour
+_DEFAULT_CATALOG_TTL = 3600.0
+
+# Live server classes by connection settings, so repeated load() calls
+# for the same server share one client (and one subprocess)
+_SHARED_SERVERS: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+_SHARED_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class _CommandSpec:
+    """Parsed server command."""
+    
+    kind: str  # "http", "npx", "python" or "stdio"
+    target: str  # URL, npm package, script path or executable
+    args: tuple[str, ...] = ()
+
+
+def _parse_npx(command: str, parts: list[str]) -> _CommandSpec:
+    # Skip npx flags (e.g. -y) to find the package name
+    package_idx = next(
+        (i for i, part in enumerate(parts[1:], 1) if not part.startswith("-")),
+        None,
+    )
+    if package_idx is None:
+        raise ValueError(f"No package given in npx command: {command}")
+    return _CommandSpec("npx", parts[package_idx], tuple(parts[package_idx + 1:]))
+
+
+def _parse_python(command: str, parts: list[str]) -> _CommandSpec:
+    return _CommandSpec("python", parts[1], tuple(parts[2:]))
+
+
+def _parse_stdio(command: str, parts: list[str]) -> _CommandSpec:
+    return _CommandSpec("stdio", parts[0], tuple(parts[1:]))
+
+
+# One match classifies the command; the matching group names its kind
+_COMMAND_PATTERN = re.compile(
+    r"(?P<http>https?://)"
+    r"|(?P<npx>npx(?:\s|$))"
+    # python/python3/python3.12 followed by a script (not -m/-c)
+    r"|(?P<python>python\S*\s+(?![\s-]))"
+)
+
+# Anything unmatched runs as a generic stdio command
+_COMMAND_PARSERS = {
+    "npx": _parse_npx,
+    "python": _parse_python,
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_command(command: str) -> _CommandSpec:
+    """
+    Classify a server command and split it into arguments.
+    
+    Args:
+        command: Server command or URL
+    
+    Returns:
+        Parsed command spec
+    """
+    command = command.strip()
+    match = _COMMAND_PATTERN.match(command)
+    kind = match.lastgroup if match and match.lastgroup else "stdio"
+    if kind == "http":
+        return _CommandSpec("http", command)
+    
+    parts = shlex.split(command)
+    if not parts:
+        raise ValueError("Empty server command")
+    
+    return _COMMAND_PARSERS.get(kind, _parse_stdio)(command, parts)
+
+
+# Transport classes are imported by the builder that uses them
+def _http_transport(spec: _CommandSpec, headers: dict[str, str] | None) -> Any:
+    from fastmcp.client.transports import StreamableHttpTransport
+    
+    return StreamableHttpTransport(
+        url=spec.target,
+        headers=headers,
+        httpx_client_factory=create_http_client,
+    )
+
+
+def _npx_transport(spec: _CommandSpec, headers: dict[str, str] | None) -> Any:
+    from fastmcp.client.transports import NpxStdioTransport
+    
+    return NpxStdioTransport(package=spec.target, args=list(spec.args))
+
+
+def _python_transport(spec: _CommandSpec, headers: dict[str, str] | None) -> Any:
+    from fastmcp.client.transports import PythonStdioTransport
+    
+    return PythonStdioTransport(script_path=spec.target, args=list(spec.args))
+
+
+def _stdio_transport(spec: _CommandSpec, headers: dict[str, str] | None) -> Any:
+    from fastmcp.client.transports import StdioTransport
+    
+    return StdioTransport(command=spec.target, args=list(spec.args))
+
+
+_TRANSPORT_BUILDERS = {
+    "http": _http_transport,
+    "npx": _npx_transport,
+    "python": _python_transport,
+    "stdio": _stdio_transport,
+}
+
+
+def _build_transport(command: str, headers: dict[str, str] | None) -> Any:
+    """
+    Create the FastMCP transport for a server command.
+    
+    Detects transport type automatically:
+    - URLs (http://, https://) → HTTP/SSE transport
+    - Commands starting with "npx" → Node stdio transport
+    - Commands starting with "python" → Python stdio transport
+    - Other commands → Generic stdio transport
+    
+    Args:
+        command: Server command or URL
+        headers: HTTP headers for remote servers
+    
+    Returns:
+        FastMCP transport instance
+    """
+    spec = _parse_command(command)
+    return _TRANSPORT_BUILDERS[spec.kind](spec, headers)
+
+
+def _resolve_command(command: str) -> str:
+    """Resolve a registered server name to its command."""
+    return get_server_command(command) or command
+
+
+def _create_client(
+    command: str,
+    headers: dict[str, str] | None = None,
+    timeout: float = 30.0,
+) -> Client:
+    """
+    Create an unconnected FastMCP client for a server command.
+    
+    Args:
+        command: Server command/URL
+        headers: HTTP headers for remote servers
+        timeout: Request timeout
+    
+    Returns:
+        FastMCP Client instance
+    """
+    try:
+        transport = _build_transport(command, headers)
+    except (ValueError, OSError) as e:
+        raise MCPConnectionError(f"Invalid server command '{command}': {e}") from e
+    
+    return Client(transport, timeout=timeout)
+
+
+@lru_cache(maxsize=1)
+def _default_sampling_handler() -> Callable | None:
+    """Default sampling handler, shared by every server that uses it."""
+    from .sampling import create_sampling_handler
+    
+    try:
+        return create_sampling_handler()
+    except ImportError:
+        # Remodl SDK not installed - server can't request completions
+        return None
+
+
+@lru_cache(maxsize=1)
+def _default_elicitation_handler() -> Callable:
+    """Default elicitation handler, shared by every server that uses it."""
+    from .elicitation import create_elicitation_handler
+    
+    return create_elicitation_handler()
+
+
+def _create_handlers(
+    on_sampling: Callable | None,
+    on_elicitation: Callable | None,
+    allow_sampling: bool,
+    allow_elicitation: bool,
+) -> tuple[Callable | None, Callable | None]:
+    """
+    Resolve sampling and elicitation handlers for a server.
+    
+    Returns:
+        Tuple of (sampling_handler, elicitation_handler)
+    """
+    # Setup sampling handler
+    if allow_sampling:
+        sampling_handler = on_sampling or _default_sampling_handler()
+    else:
+        sampling_handler = None
+    
+    # Setup elicitation handler
+    if allow_elicitation:
+        elicitation_handler = on_elicitation or _default_elicitation_handler()
+    else:
+        elicitation_handler = None
+    
+    return sampling_handler, elicitation_handler
+
+
+async def _list_capabilities(wrapper: MCPClientWrapper) -> dict[str, Any]:
+    """Connect if needed and list a server's tools, resources and prompts."""
+    return (await wrapper._list_all())._asdict()
+
+
+def _server_stamp(command: str) -> int | None:
+    """
+    Version stamp of a local server, for catalog invalidation.
+    
+    The mtime of the Python script, or of the executable for other
+    stdio commands, so editing or upgrading a server discards its
+    cached catalog. None for HTTP servers.
+    
+    Raises:
+        MCPConnectionError: If the server's executable isn't on PATH
+    """
+    try:
+        spec = _parse_command(command)
+    except ValueError:
+        return None
+    
+    if spec.kind == "http":
+        return None
+    if spec.kind == "python":
+        path = spec.target
+    else:
+        executable = "npx" if spec.kind == "npx" else spec.target
+        found = shutil.which(executable)
+        if found is None:
+            raise MCPConnectionError(f"Executable not found: {executable}")
+        path = found
+    
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+async def _refresh_catalog(
+    wrapper: MCPClientWrapper,
+    command: str,
+    stamp: int | None,
+    headers: dict[str, str] | None,
+) -> None:
+    """Re-list a server loaded from its cached catalog and update the cache."""
+    try:
+        save_catalog(command, await _list_capabilities(wrapper), stamp, headers)
+    except Exception:
+        # Best-effort; the cached catalog stays until it expires
+        pass
+
+
+async def _initialize(
+    wrapper: MCPClientWrapper,
+    command: str,
+    catalog_ttl: float | None = None,
+    headers: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """
+    Connect to a server and fetch its capabilities.
+    
+    The client session is left open so later tool calls reuse it.
+    When catalog_ttl is set and a fresh cached catalog exists, it is
+    returned without connecting at all; the session is then opened
+    on first use, and the catalog re-listed and re-cached in the
+    background (stale-while-revalidate). A newly listed catalog is
+    cached.
+    
+    Args:
+        wrapper: Client wrapper for the server
+        command: Server command (catalog cache key)
+        catalog_ttl: Maximum cached catalog age in seconds
+        headers: HTTP headers the server is loaded with (catalog cache key)
+    
+    Returns:
+        Dict with server_info, tools, resources and prompts
+    """
+    stamp = _server_stamp(command) if catalog_ttl else None
+    if catalog_ttl:
+        cached = load_catalog(command, catalog_ttl, stamp, headers)
+        if cached is not None:
+            wrapper.on_connect = partial(_refresh_catalog, wrapper, command, stamp, headers)
+            return cached
+    
+    capabilities = await _list_capabilities(wrapper)
+    
+    if catalog_ttl:
+        try:
+            save_catalog(command, capabilities, stamp, headers)
+        except OSError:
+            # Caching is best-effort
+            pass
+    
+    return capabilities
+
+
+def _create_server(
+    client: MCPClientWrapper,
+    capabilities: dict[str, Any],
+    sampling_handler: Callable | None,
+    elicitation_handler: Callable | None,
+) -> Any:
+    """Build and instantiate the dynamic server class."""
+    server_class = create_server_class(
+        name=capabilities["server_info"].name,
+        tools=capabilities["tools"],
+        resources=capabilities["resources"],
+        prompts=capabilities["prompts"],
+        client=client,
+        sampling_handler=sampling_handler,
+        elicitation_handler=elicitation_handler,
+    )
+    return server_class()
+
+
+def _start_servers(
+    commands: dict[str, str],
+) -> dict[str, tuple[MCPClientWrapper, concurrent.futures.Future]]:
+    """Create clients for all commands and start initializing them at once."""
+    resolved = {name: _resolve_command(command) for name, command in commands.items()}
+    clients = {name: _create_client(command) for name, command in resolved.items()}
+    started = {}
+    for name, client in clients.items():
+        wrapper = MCPClientWrapper(client)
+        coro = _initialize(wrapper, resolved[name], _DEFAULT_CATALOG_TTL)
+        started[name] = (wrapper, wrapper.submit(coro))
+    return started
+
+
+def _collect_servers(
+    started: dict[str, tuple[MCPClientWrapper, concurrent.futures.Future]],
+) -> dict[str, Any]:
+    """
+    Build server objects once every initialization has finished.
+    
+    The caller closes the wrappers if this raises.
+    """
+    failures = {
+        name: future.exception()
+        for name, (_, future) in started.items()
+        if future.exception() is not None
+    }
+    if failures:
+        details = "; ".join(f"{name}: {error}" for name, error in failures.items())
+        raise MCPConnectionError(f"Failed to connect to servers: {details}")
+    
+    handlers = _create_handlers(None, None, True, True)
+    return {
+        name: _create_server(wrapper, future.result(), *handlers)
+        for name, (wrapper, future) in started.items()
+    }
+
+
+def _share_key(
+    command: str,
+    headers: dict[str, str] | None,
+    on_sampling: Callable | None,
+    on_elicitation: Callable | None,
+    allow_sampling: bool,
+    allow_elicitation: bool,
+    timeout: float,
+    share: bool,
+) -> tuple | None:
+    """Key for sharing a loaded server, or None if it can't be shared."""
+    if not share or on_sampling is not None or on_elicitation is not None:
+        return None
+    return (
+        command,
+        tuple(sorted((headers or {}).items())),
+        timeout,
+        allow_sampling,
+        allow_elicitation,
+    )
+
+
+def _shared_server(share_key: tuple | None) -> Any | None:
+    """Return a new reference to an open shared server, if there is one."""
+    if share_key is None:
+        return None
+    with _SHARED_LOCK:
+        server_class = _SHARED_SERVERS.get(share_key)
+        if server_class is not None and server_class._client.acquire():
+            return server_class()
+    return None
+
+
+def _finish_load(
+    wrapper: MCPClientWrapper,
+    capabilities: dict[str, Any],
+    handlers: tuple[Callable | None, Callable | None],
+    share_key: tuple | None,
+) -> Any:
+    """Build the server object and register it for sharing."""
+    server = _create_server(wrapper, capabilities, *handlers)
+    if share_key is not None:
+        with _SHARED_LOCK:
+            _SHARED_SERVERS[share_key] = type(server)
+    return server
 
 
 def load(
@@ -34,6 +447,8 @@ def load(
     allow_elicitation: bool = True,
     auto_auth: bool = True,
     timeout: float = 30.0,
+    catalog_ttl: float | None = _DEFAULT_CATALOG_TTL,
+    share: bool = True,
 ) -> Any:
     """
     Load an MCP server and return it as a Python module.
@@ -54,111 +469,182 @@ def load(
         allow_elicitation: Whether to allow user input
         auto_auth: Auto-handle OAuth
         timeout: Request timeout
+        catalog_ttl: Seconds a cached tool catalog stays valid (None disables caching)
+        share: Reuse the connection of an open server loaded with the same
+            settings (never shared when custom handlers are given)
     
     Returns:
         Dynamic server object with tools as methods
     """
-    # Check registry first
-    registered_command = get_server_command(command)
-    if registered_command:
-        command = registered_command
-    
-    # Detect transport type
-    if command.startswith(("http://", "https://")):
-        transport = StreamableHttpTransport(
-            url=command,
-            headers=headers or {},
-            timeout=timeout
-        )
-    elif command.startswith("npx"):
-        transport = NpxStdioTransport(command=command)
-    elif command.startswith("python"):
-        transport = PythonStdioTransport(command=command)
-    else:
-        transport = StdioTransport(command=command)
-    
-    # Create client
-    client = Client(transport)
-    
-    # Setup sampling handler
-    if allow_sampling:
-        sampling_handler = on_sampling or create_sampling_handler()
-    else:
-        sampling_handler = None
+    command = _resolve_command(command)
+    share_key = _share_key(
+        command, headers, on_sampling, on_elicitation,
+        allow_sampling, allow_elicitation, timeout, share,
+    )
+    server = _shared_server(share_key)
+    if server is not None:
+        return server
     
-    # Setup elicitation handler
-    if allow_elicitation:
-        elicitation_handler = on_elicitation or create_elicitation_handler()
-    else:
-        elicitation_handler = None
+    client = _create_client(command, headers=headers, timeout=timeout)
+    wrapper = MCPClientWrapper(client)
     
     # Initialize connection and get server capabilities
     try:
-        # Connect and initialize
-        async def _init():
-            async with client:
-                # Initialize server
-                init_result = await client.initialize()
-                
-                # List tools, resources, prompts
-                tools_result = await client.list_tools()
-                resources_result = await client.list_resources()
-                prompts_result = await client.list_prompts()
-                
-                return {
-                    "server_info": init_result.server_info,
-                    "tools": tools_result.tools,
-                    "resources": resources_result.resources if resources_result else [],
-                    "prompts": prompts_result.prompts if prompts_result else [],
-                }
-        
-        # Run async initialization
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        capabilities = loop.run_until_complete(_init())
-        
+        capabilities = wrapper.run_async(
+            _initialize(wrapper, command, catalog_ttl, headers)
+        )
+        handlers = _create_handlers(
+            on_sampling, on_elicitation, allow_sampling, allow_elicitation
+        )
+        return _finish_load(wrapper, capabilities, handlers, share_key)
     except Exception as e:
+        wrapper.close()
         raise MCPConnectionError(f"Failed to connect to server: {e}") from e
-    
-    # Create dynamic server class
-    server_class = create_server_class(
-        name=capabilities["server_info"].name,
-        tools=capabilities["tools"],
-        resources=capabilities["resources"],
-        prompts=capabilities["prompts"],
-        client=client,
-        sampling_handler=sampling_handler,
-        elicitation_handler=elicitation_handler,
-    )
-    
-    # Instantiate and return
-    return server_class()
 
 
 async def aload(
     command: str,
-    **kwargs: Any,
+    *,
+    headers: dict[str, str] | None = None,
+    roots: str | list[str] | None = None,
+    on_sampling: Callable | None = None,
+    on_elicitation: Callable | None = None,
+    allow_sampling: bool = True,
+    allow_elicitation: bool = True,
+    auto_auth: bool = True,
+    timeout: float = 30.0,
+    catalog_ttl: float | None = _DEFAULT_CATALOG_TTL,
+    share: bool = True,
 ) -> Any:
     """
     Async version of load().
     
-    All tools become async methods that must be awaited.
+    The connection handshake is awaited instead of blocking, so the
+    caller's event loop keeps running while the server starts. Takes
+    the same options as load() and returns the same server object;
+    await a tool's acall() to call it without blocking as well.
     
     Args:
         command: Server command/URL or registered name
-        **kwargs: Same options as load()
     
     Returns:
-        Dynamic server object with async methods
+        Dynamic server object with tools as methods
     
     Example:
         >>> server = await aload("npx -y server-filesystem /tmp")
-        >>> files = await server.list_directory(path="/tmp")
-        >>> await server.close()
+        >>> files = await server.list_directory.acall(path="/tmp")
+        >>> server.close()
+    """
+    command = _resolve_command(command)
+    share_key = _share_key(
+        command, headers, on_sampling, on_elicitation,
+        allow_sampling, allow_elicitation, timeout, share,
+    )
+    server = _shared_server(share_key)
+    if server is not None:
+        return server
+    
+    client = _create_client(command, headers=headers, timeout=timeout)
+    wrapper = MCPClientWrapper(client)
+    
+    try:
+        capabilities = await wrapper.arun(
+            _initialize(wrapper, command, catalog_ttl, headers)
+        )
+        handlers = _create_handlers(
+            on_sampling, on_elicitation, allow_sampling, allow_elicitation
+        )
+        return _finish_load(wrapper, capabilities, handlers, share_key)
+    except BaseException as e:
+        # Also reached when the caller is cancelled mid-handshake
+        await wrapper.aclose()
+        if isinstance(e, Exception):
+            raise MCPConnectionError(f"Failed to connect to server: {e}") from e
+        raise
+
+
+async def aload_servers(**commands: str) -> dict[str, Any]:
+    """
+    Load several MCP servers concurrently.
+    
+    Every server is spawned and initialized at the same time, so
+    startup takes as long as the slowest server instead of the sum
+    of all of them.
+    
+    Args:
+        **commands: Mapping of names to server commands/URLs or registered names
+    
+    Returns:
+        Dictionary of names to dynamic server objects
+    
+    Raises:
+        MCPConnectionError: If any server fails to connect
+    
+    Example:
+        >>> servers = await aload_servers(
+        ...     weather="weather",
+        ...     fs="npx -y @modelcontextprotocol/server-filesystem /tmp",
+        ... )
+        >>> servers["fs"].list_directory(path="/tmp")
+    """
+    started = _start_servers(commands)
+    try:
+        # Failures are collected from the futures below
+        await asyncio.gather(
+            *(asyncio.wrap_future(future) for _, future in started.values()),
+            return_exceptions=True,
+        )
+        return _collect_servers(started)
+    except BaseException:
+        # Also reached when the caller is cancelled mid-startup
+        for _, future in started.values():
+            future.cancel()
+        await asyncio.gather(
+            *(wrapper.aclose() for wrapper, _ in started.values()),
+            return_exceptions=True,
+        )
+        raise
+
+
+def load_servers(**commands: str) -> dict[str, Any]:
+    """
+    Load several MCP servers concurrently.
+    
+    Sync version of aload_servers().
+    
+    Args:
+        **commands: Mapping of names to server commands/URLs or registered names
+    
+    Returns:
+        Dictionary of names to dynamic server objects
+    
+    Example:
+        >>> servers = load_servers(weather="weather", fs="filesystem")
+        >>> servers["weather"].get_forecast(city="Miami")
+    """
+    started = _start_servers(commands)
+    concurrent.futures.wait([future for _, future in started.values()])
+    try:
+        return _collect_servers(started)
+    except BaseException:
+        for wrapper, _ in started.values():
+            wrapper.close()
+        raise
+
+
+def load_all() -> dict[str, Any]:
+    """
+    Load every registered server concurrently.
+    
+    Returns:
+        Dictionary of registered names to dynamic server objects
+    
+    Example:
+        >>> register(weather="npx -y @h1deya/mcp-server-weather")
+        >>> servers = load_all()
+        >>> servers["weather"].get_forecast(city="Miami")
     """
-    # TODO: Implement fully async version
-    # For now, use sync version
-    return load(command, **kwargs)
+    return load_servers(**list_servers())
 
 
-__all__ = ["load", "aload"]
+__all__ = ["load", "aload", "load_servers", "aload_servers", "load_all"]
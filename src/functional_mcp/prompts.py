@@ -6,6 +6,8 @@ Converts MCP prompts into callable template functions.
 
 from typing import Any
 
+from .client import run_sync
+
 
 def create_prompt_function(prompt: Any, client: Any) -> callable:
     """
@@ -21,8 +23,6 @@ def create_prompt_function(prompt: Any, client: Any) -> callable:
     
     async def prompt_fn(**kwargs) -> str:
         """Get formatted prompt from server."""
-        import asyncio
-        
         result = await client.get_prompt(prompt.name, kwargs)
         
         # Format messages into string
@@ -36,14 +36,9 @@ def create_prompt_function(prompt: Any, client: Any) -> callable:
         
         return str(result)
     
-    # Make sync wrapper
+    # Make sync wrapper (runs on the shared client loop)
     def sync_prompt_fn(**kwargs) -> str:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(prompt_fn(**kwargs))
-        finally:
-            loop.close()
+        return run_sync(prompt_fn(**kwargs))
     
     sync_prompt_fn.__name__ = prompt.name
     sync_prompt_fn.__doc__ = prompt.description or f"MCP prompt: {prompt.name}"
@@ -4,13 +4,47 @@ Server registry for storing commonly-used MCP servers.
 Allows registering servers by name for easy loading.
 """
 
-import json
 import os
+import threading
 from pathlib import Path
 
+from . import _json
+from .utils import write_bytes
+
 
 _REGISTRY_PATH = Path.home() / ".config" / "functional-mcp" / "servers.json"
 _registry: dict[str, str] = {}
+# (mtime_ns, size) of the file _registry was read from
+_registry_stamp: tuple[int, int] | None = None
+# Serializes reloads and register()'s read-modify-write
+_registry_lock = threading.RLock()
+
+
+def _file_stamp() -> tuple[int, int] | None:
+    """Get (mtime_ns, size) of the registry file, or None if missing."""
+    try:
+        stat = _REGISTRY_PATH.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_registry() -> dict[str, str]:
+    """
+    Get the registry, re-reading the file only when it changed.
+    
+    Returns:
+        Dictionary of server names to commands
+    """
+    global _registry, _registry_stamp
+    
+    with _registry_lock:
+        stamp = _file_stamp()
+        if stamp is not None and stamp != _registry_stamp:
+            _registry = _json.loads(_REGISTRY_PATH.read_bytes())
+            _registry_stamp = stamp
+        
+        return _registry
 
 
 def register(**servers: str) -> None:
@@ -35,20 +69,18 @@ def register(**servers: str) -> None:
         fs = load("filesystem")
         ```
     """
-    global _registry
-    
-    # Load existing registry
-    if _REGISTRY_PATH.exists():
-        with open(_REGISTRY_PATH) as f:
-            _registry = json.load(f)
+    global _registry_stamp
     
-    # Update with new servers
-    _registry.update(servers)
-    
-    # Save to disk
-    _REGISTRY_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(_REGISTRY_PATH, 'w') as f:
-        json.dump(_registry, f, indent=2)
+    with _registry_lock:
+        # Update existing registry with new servers
+        registry = _load_registry()
+        registry.update(servers)
+        
+        # Save to disk atomically, so readers never see a partial file
+        tmp_path = _REGISTRY_PATH.with_name(f"{_REGISTRY_PATH.name}.{os.getpid()}.tmp")
+        write_bytes(tmp_path, _json.dumps(registry, indent=True))
+        os.replace(tmp_path, _REGISTRY_PATH)
+        _registry_stamp = _file_stamp()
 
 
 def get_server_command(name: str) -> str | None:
@@ -61,14 +93,7 @@ def get_server_command(name: str) -> str | None:
     Returns:
         Server command/URL or None if not found
     """
-    global _registry
-    
-    # Load registry if empty
-    if not _registry and _REGISTRY_PATH.exists():
-        with open(_REGISTRY_PATH) as f:
-            _registry = json.load(f)
-    
-    return _registry.get(name)
+    return _load_registry().get(name)
 
 
 def list_servers() -> dict[str, str]:
@@ -78,13 +103,7 @@ def list_servers() -> dict[str, str]:
     Returns:
         Dictionary of server names to commands
     """
-    global _registry
-    
-    if not _registry and _REGISTRY_PATH.exists():
-        with open(_REGISTRY_PATH) as f:
-            _registry = json.load(f)
-    
-    return _registry.copy()
+    return _load_registry().copy()
 
 
 __all__ = ["register", "get_server_command", "list_servers"]
@@ -6,6 +6,8 @@ Converts MCP resources into properties or constants.
 
 from typing import Any
 
+from .client import run_sync
+
 
 def create_resource_property(resource: Any, client: Any) -> property:
     """
@@ -22,8 +24,6 @@ def create_resource_property(resource: Any, client: Any) -> property:
     @property
     def resource_prop(self):
         """Access MCP resource."""
-        import asyncio
-        
         async def _get():
             result = await client.read_resource(resource.uri)
             # Return first content block
@@ -31,12 +31,8 @@ def create_resource_property(resource: Any, client: Any) -> property:
                 return result.contents[0].text if hasattr(result.contents[0], 'text') else result.contents[0]
             return None
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(_get())
-        finally:
-            loop.close()
+        # Runs on the shared client loop
+        return run_sync(_get())
     
     resource_prop.__doc__ = resource.description or f"MCP resource: {resource.uri}"
     return resource_prop
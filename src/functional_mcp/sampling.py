@@ -5,6 +5,7 @@ When MCP servers request LLM completions, this module handles
 those requests using the Remodl SDK instead of litellm.
 """
 
+import asyncio
 import os
 from typing import Any, Callable
 
@@ -29,6 +30,9 @@ def create_sampling_handler() -> Callable:
             "Remodl SDK required for sampling. Install with: pip install remodl-ai"
         )
     
+    # Older SDKs only have the blocking completion()
+    acompletion = getattr(remodl, "acompletion", None)
+    
     # Determine default model based on available keys
     def get_default_model() -> str:
         if os.getenv("REMODL_API_KEY"):
@@ -74,12 +78,20 @@ def create_sampling_handler() -> Callable:
         if not model:
             model = get_default_model()
         
-        # Call Remodl SDK
-        response = remodl.completion(
-            model=model,
-            messages=full_messages,
-            max_tokens=max_tokens
-        )
+        # Call Remodl SDK without blocking the client's event loop
+        if acompletion is not None:
+            response = await acompletion(
+                model=model,
+                messages=full_messages,
+                max_tokens=max_tokens
+            )
+        else:
+            response = await asyncio.to_thread(
+                remodl.completion,
+                model=model,
+                messages=full_messages,
+                max_tokens=max_tokens
+            )
         
         return response.choices[0].message.content
     
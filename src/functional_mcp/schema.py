@@ -7,6 +7,25 @@ Handles type mapping for tool arguments and return values.
 from typing import Any, get_origin, get_args
 
 
+# Scalar JSON Schema types and their Python equivalents
+_PY_SCALAR: dict[str, Any] = {
+    "string": str,
+    "number": float,
+    "integer": int,
+    "boolean": bool,
+    "object": dict[str, Any],
+    "null": type(None),
+}
+
+_JSON_SCALAR: dict[Any, dict[str, str]] = {
+    str: {"type": "string"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    bool: {"type": "boolean"},
+    type(None): {"type": "null"},
+}
+
+
 def json_schema_to_python_type(schema: dict[str, Any]) -> type:
     """
     Convert JSON Schema type to Python type.
@@ -23,27 +42,18 @@ def json_schema_to_python_type(schema: dict[str, Any]) -> type:
         >>> json_schema_to_python_type({"type": "array", "items": {"type": "string"}})
         list[str]
     """
-    schema_type = schema.get("type")
+    # Unwrap nested arrays iteratively
+    depth = 0
+    while schema.get("type") == "array":
+        depth += 1
+        schema = schema.get("items", {})
     
-    if schema_type == "string":
-        return str
-    elif schema_type == "number":
-        return float
-    elif schema_type == "integer":
-        return int
-    elif schema_type == "boolean":
-        return bool
-    elif schema_type == "array":
-        items_schema = schema.get("items", {})
-        item_type = json_schema_to_python_type(items_schema)
-        return list[item_type]  # type: ignore
-    elif schema_type == "object":
-        return dict[str, Any]
-    elif schema_type == "null":
-        return type(None)
-    else:
-        # Unknown or complex type
-        return Any
+    # Unknown or complex types (incl. type unions) become Any
+    schema_type = schema.get("type")
+    py_type = _PY_SCALAR.get(schema_type, Any) if isinstance(schema_type, str) else Any
+    for _ in range(depth):
+        py_type = list[py_type]  # type: ignore
+    return py_type
 
 
 def python_type_to_json_schema(py_type: type) -> dict[str, Any]:
@@ -71,20 +81,9 @@ def python_type_to_json_schema(py_type: type) -> dict[str, Any]:
     elif origin is dict:
         return {"type": "object"}
     
-    # Handle basic types
-    elif py_type is str:
-        return {"type": "string"}
-    elif py_type is int:
-        return {"type": "integer"}
-    elif py_type is float:
-        return {"type": "number"}
-    elif py_type is bool:
-        return {"type": "boolean"}
-    elif py_type is type(None):
-        return {"type": "null"}
-    else:
-        # Unknown type
-        return {"type": "object"}
+    # Handle basic types (unknown types map to object)
+    scalar = _JSON_SCALAR.get(py_type) if isinstance(py_type, type) else None
+    return dict(scalar) if scalar else {"type": "object"}
 
 
 __all__ = ["json_schema_to_python_type", "python_type_to_json_schema"]
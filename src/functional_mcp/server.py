@@ -5,8 +5,54 @@ Creates a Python class where MCP tools become methods,
 resources become properties, and prompts become template functions.
 """
 
+import time
+from types import MappingProxyType
 from typing import Any, Callable
-from functools import wraps
+from pydantic import AnyUrl, ValidationError
+
+from . import _json
+from .exceptions import MCPToolError
+from .tools import _argument_validator, _signature_from_schema
+from .utils import to_pascal_case, to_snake_case
+
+
+# Resources under these schemes change between reads
+_DYNAMIC_PREFIXES = ("dynamic://", "live://")
+
+# Seconds static resource contents are reused before being re-read
+_RESOURCE_TTL = 60.0
+
+
+def _normalize_uri(uri: str) -> str:
+    """Normalize a URI as resource listings do (file://readme → file://readme/)."""
+    try:
+        return str(AnyUrl(uri))
+    except ValidationError:
+        return uri
+
+
+def _resource_property(resource: Any, cached: bool) -> property:
+    """Create the property that reads a resource from the server."""
+    uri = str(resource.uri)
+    
+    if cached:
+        # Static resources are re-read once their contents are older
+        # than _RESOURCE_TTL, or after invalidate_resource()
+        def resource_prop(self: Any) -> Any:
+            """Access MCP resource."""
+            now = time.monotonic()
+            entry = self._resource_cache.get(uri)
+            if entry is None or entry[0] <= now:
+                entry = (now + _RESOURCE_TTL, tuple(self._client.read_resource(uri)))
+                self._resource_cache[uri] = entry
+            # A new list per access, so callers can't alter the cache
+            return list(entry[1])
+    else:
+        def resource_prop(self: Any) -> Any:
+            """Access MCP resource."""
+            return self._client.read_resource(uri)
+    
+    return property(resource_prop, doc=resource.description or f"MCP resource: {uri}")
 
 
 def create_server_class(
@@ -29,27 +75,25 @@ def create_server_class(
         tools: List of MCP tool definitions
         resources: List of MCP resource definitions
         prompts: List of MCP prompt definitions
-        client: FastMCP Client instance
+        client: MCPClientWrapper instance
         sampling_handler: Handler for LLM requests
         elicitation_handler: Handler for user input
     
     Returns:
         Dynamic server class
     """
-    
-    # Convert tool names to snake_case
-    def to_snake_case(name: str) -> str:
-        """Convert camelCase to snake_case."""
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    class_name = f"{to_pascal_case(name)}Server"
     
     # Create class dict
+    # All state except the closed flag lives on the class, so
+    # instances need no __dict__
     class_dict = {
+        "__slots__": ("_closed",),
         "_client": client,
         "_tools_map": {},
         "_resources_map": {},
         "_prompts_map": {},
+        "_resource_cache": {},  # URI -> (expiry, static resource contents)
         "tools": [],  # For AI SDK integration
     }
     
@@ -62,49 +106,56 @@ def create_server_class(
         class_dict["_tools_map"][method_name] = tool
         
         # Create method
-        def create_tool_method(t):
-            @wraps(lambda: None)  # Placeholder for proper wrapping
-            async def tool_method(self, **kwargs):
+        def create_tool_method(t, name):
+            schema_json = _json.dumps(t.inputSchema or {})
+            # Invalid arguments fail locally instead of after a round-trip
+            check_arguments = _argument_validator(t.name, schema_json)
+            
+            def call(**kwargs: Any) -> Any:
                 """Execute MCP tool."""
+                if check_arguments is not None:
+                    check_arguments(kwargs)
                 try:
-                    result = await self._client.call_tool(t.name, kwargs)
+                    result = client.call_tool(t.name, kwargs)
                     return result.content
                 except Exception as e:
-                    from .exceptions import MCPToolError
                     raise MCPToolError(t.name, str(e), e) from e
             
-            # Set metadata
-            tool_method.__name__ = method_name
-            tool_method.__doc__ = t.description or f"MCP tool: {t.name}"
-            
-            # For AI SDKs - callable version
-            def sdk_callable(**kwargs):
-                """Sync wrapper for AI SDKs."""
-                import asyncio
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+            async def acall(**kwargs: Any) -> Any:
+                """Execute MCP tool from async code."""
+                if check_arguments is not None:
+                    check_arguments(kwargs)
                 try:
-                    return loop.run_until_complete(tool_method(None, **kwargs))
-                finally:
-                    loop.close()
+                    result = await client.acall_tool(t.name, kwargs)
+                    return result.content
+                except Exception as e:
+                    raise MCPToolError(t.name, str(e), e) from e
             
-            sdk_callable.__name__ = method_name
-            sdk_callable.__doc__ = tool_method.__doc__
+            # Set metadata
+            call.acall = acall
+            call.__name__ = name
+            call.__qualname__ = f"{class_name}.{name}"
+            call.__doc__ = t.description or f"MCP tool: {t.name}"
+            # Parameters from the input schema, for AI SDK introspection
+            call.__signature__ = acall.__signature__ = _signature_from_schema(schema_json)
             
-            return tool_method, sdk_callable
+            return call
         
-        method, sdk_method = create_tool_method(tool)
-        class_dict[method_name] = method
-        class_dict["tools"].append(sdk_method)
+        # One callable serves as both the method and the AI SDK tool.
+        # As a staticmethod, server.tool(...) calls it directly with
+        # no bound-method wrapper or extra frame.
+        method = create_tool_method(tool, method_name)
+        class_dict[method_name] = staticmethod(method)
+        class_dict["tools"].append(method)
     
     # Add resources as properties
     for resource in resources:
-        resource_uri = resource.uri
+        resource_uri = str(resource.uri)
         resource_name = resource.name or resource_uri.split("/")[-1]
         
         # Static resources → UPPER_CASE
         # Dynamic resources → lowercase properties
-        is_static = not resource.uri.startswith(("dynamic://", "live://"))
+        is_static = not resource_uri.startswith(_DYNAMIC_PREFIXES)
         
         if is_static:
             prop_name = to_snake_case(resource_name).upper()
@@ -113,42 +164,28 @@ def create_server_class(
         
         class_dict["_resources_map"][prop_name] = resource
         
-        def create_resource_property(res):
-            @property
-            def resource_prop(self):
-                """Access MCP resource."""
-                import asyncio
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    async def _get():
-                        result = await self._client.read_resource(res.uri)
-                        return result.contents
-                    return loop.run_until_complete(_get())
-                finally:
-                    loop.close()
-            
-            resource_prop.__doc__ = res.description or f"MCP resource: {res.uri}"
-            return resource_prop
-        
-        class_dict[prop_name] = create_resource_property(resource)
+        class_dict[prop_name] = _resource_property(resource, is_static)
     
     # Add prompts as template functions
     for prompt in prompts:
         prompt_name = to_snake_case(prompt.name)
         class_dict["_prompts_map"][prompt_name] = prompt
         
-        def create_prompt_function(p):
-            async def prompt_fn(self, **kwargs):
+        def create_prompt_function(p, name):
+            def prompt_fn(self, **kwargs):
                 """Get formatted prompt."""
-                result = await self._client.get_prompt(p.name, kwargs)
+                result = self._client.get_prompt(p.name, kwargs)
                 return result.messages
             
-            prompt_fn.__name__ = prompt_name
+            prompt_fn.__name__ = name
+            prompt_fn.__qualname__ = f"{class_name}.{name}"
             prompt_fn.__doc__ = p.description or f"MCP prompt: {p.name}"
             return prompt_fn
         
-        class_dict[prompt_name] = create_prompt_function(prompt)
+        class_dict[prompt_name] = create_prompt_function(prompt, prompt_name)
+    
+    def __init__(self):
+        self._closed = False
     
     # Add context manager support
     def __enter__(self):
@@ -160,24 +197,37 @@ def create_server_class(
     
     def close(self):
         """Close the server connection."""
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(self._client.__aexit__(None, None, None))
-        finally:
-            loop.close()
+        # Instances may share a client, so each releases it only once
+        if self._closed:
+            return
+        self._closed = True
+        self._client.close()
+    
+    def invalidate_resource(self: Any, uri: str | None = None) -> None:
+        """
+        Drop cached static resource contents.
+        
+        Args:
+            uri: Resource URI to re-read on next access, as the server
+                registered it (None drops all)
+        """
+        if uri is None:
+            self._resource_cache.clear()
+        else:
+            self._resource_cache.pop(_normalize_uri(uri), None)
     
+    class_dict["__init__"] = __init__
     class_dict["__enter__"] = __enter__
     class_dict["__exit__"] = __exit__
     class_dict["close"] = close
+    class_dict["invalidate_resource"] = invalidate_resource
+    
+    # Definitions are fixed once the class is built
+    for key in ("_tools_map", "_resources_map", "_prompts_map"):
+        class_dict[key] = MappingProxyType(class_dict[key])
     
     # Create the class
-    server_class = type(
-        f"{name.replace(' ', '')}Server",
-        (object,),
-        class_dict
-    )
+    server_class = type(class_name, (object,), class_dict)
     
     return server_class
 
@@ -7,15 +7,72 @@ for full autocomplete and type checking.
 
 import hashlib
 from pathlib import Path
+from typing import IO, Any, Iterator
+
+from .utils import to_pascal_case, to_snake_case, write_bytes
+
+
+_STUB_DIR = Path.home() / ".cache" / "functional-mcp" / "stubs"
+
+# JSON Schema type → Python annotation
+_PYTHON_TYPES = {
+    "string": "str",
+    "number": "float",
+    "integer": "int",
+    "boolean": "bool",
+    "array": "list",
+    "object": "dict",
+}
+
+_STUB_HEADER = '''# Type stubs for MCP server
+# Server: {server_name}
+#
+# Auto-generated by functional-mcp
+
 from typing import Any
 
+class {class_name}:
+    """MCP Server Interface"""
+
+'''
+
+_TOOL_TEMPLATE = """    def {name}(self, {params}) -> dict[str, Any]:
+{doc}        ...
+
+"""
+
+_RESOURCE_TEMPLATE = """    {name}: Any
+{doc}
+"""
+
+_PROMPT_TEMPLATE = """    def {name}(self, **kwargs: Any) -> str:
+{doc}        ...
+
+"""
+
+_STUB_FOOTER = (
+    '    @property\n'
+    '    def tools(self) -> list[Any]:\n'
+    '        """Get tools as callable list for AI SDKs."""\n'
+    '        ...\n'
+    '\n'
+    '    def invalidate_resource(self, uri: str | None = None) -> None:\n'
+    '        """Drop cached static resource contents."""\n'
+    '        ...\n'
+    '\n'
+    '    def close(self) -> None:\n'
+    '        """Close server connection."""\n'
+    '        ...\n'
+)
+
 
 def generate_stub(
     server_name: str,
     tools: list[Any],
     resources: list[Any],
     prompts: list[Any],
-) -> str:
+    out: IO[str] | None = None,
+) -> str | None:
     """
     Generate .pyi stub content for a server.
     
@@ -24,91 +81,77 @@ def generate_stub(
         tools: List of MCP tools
         resources: List of MCP resources
         prompts: List of MCP prompts
+        out: Text stream to write the stub to chunk by chunk, instead
+            of building and returning one string
     
     Returns:
-        Stub file content as string
+        Stub file content as string, or None when written to out
     """
-    lines = [
-        "# Type stubs for MCP server",
-        f"# Server: {server_name}",
-        "#",
-        "# Auto-generated by functional-mcp",
-        "",
-        "from typing import Any",
-        "",
-        f"class {server_name.replace(' ', '')}Server:",
-        '    """MCP Server Interface"""',
-        "",
-    ]
+    chunks = _iter_stub_chunks(server_name, tools, resources, prompts)
+    if out is not None:
+        # Stream without holding the full stub in memory
+        for chunk in chunks:
+            out.write(chunk)
+        return None
+    
+    return "".join(chunks)
+
+
+def _docstring(description: str | None, indent: str) -> str:
+    """Format an optional one-line docstring."""
+    return f'{indent}"""{description}"""\n' if description else ""
+
+
+def _render_tool(tool: Any) -> str:
+    """Build the stub method for one tool."""
+    # Get input schema
+    input_schema = tool.inputSchema or {}
+    properties = input_schema.get("properties", {})
+    
+    params = ", ".join(
+        f"{param_name}: {_PYTHON_TYPES.get(param_schema.get('type', 'string'), 'Any')}"
+        for param_name, param_schema in properties.items()
+    )
+    return _TOOL_TEMPLATE.format(
+        name=to_snake_case(tool.name),
+        params=params,
+        doc=_docstring(tool.description, "        "),
+    )
+
+
+def _iter_stub_chunks(
+    server_name: str,
+    tools: list[Any],
+    resources: list[Any],
+    prompts: list[Any],
+) -> Iterator[str]:
+    """Yield .pyi stub content piece by piece."""
+    yield _STUB_HEADER.format(
+        server_name=server_name,
+        class_name=f"{to_pascal_case(server_name)}Server",
+    )
     
     # Add tool methods
     for tool in tools:
-        tool_name = tool.name
-        # Convert to snake_case
-        method_name = tool_name.replace("-", "_").replace(" ", "_").lower()
-        
-        # Get input schema
-        input_schema = tool.inputSchema or {}
-        properties = input_schema.get("properties", {})
-        
-        # Build parameter list
-        params = []
-        for param_name, param_schema in properties.items():
-            param_type = param_schema.get("type", "string")
-            python_type = {
-                "string": "str",
-                "number": "float",
-                "integer": "int",
-                "boolean": "bool",
-                "array": "list",
-                "object": "dict",
-            }.get(param_type, "Any")
-            
-            params.append(f"{param_name}: {python_type}")
-        
-        params_str = ", ".join(params) if params else ""
-        
-        # Add method signature
-        lines.append(f"    def {method_name}(self, {params_str}) -> dict[str, Any]:")
-        
-        # Add docstring
-        if tool.description:
-            lines.append(f'        """{tool.description}"""')
-        
-        lines.append("        ...")
-        lines.append("")
+        yield _render_tool(tool)
     
     # Add resource properties
     for resource in resources:
-        resource_name = (resource.name or resource.uri.split("/")[-1]).replace("-", "_").upper()
-        lines.append(f"    {resource_name}: Any")
-        if resource.description:
-            lines.append(f'    """{resource.description}"""')
-        lines.append("")
+        resource_name = resource.name or str(resource.uri).split("/")[-1]
+        yield _RESOURCE_TEMPLATE.format(
+            name=to_snake_case(resource_name).upper(),
+            doc=_docstring(resource.description, "    "),
+        )
     
     # Add prompt functions
     for prompt in prompts:
-        prompt_name = prompt.name.replace("-", "_").lower()
-        lines.append(f"    def {prompt_name}(self, **kwargs: Any) -> str:")
-        if prompt.description:
-            lines.append(f'        """{prompt.description}"""')
-        lines.append("        ...")
-        lines.append("")
+        yield _PROMPT_TEMPLATE.format(
+            name=to_snake_case(prompt.name),
+            doc=_docstring(prompt.description, "        "),
+        )
     
     # Add utility methods
-    lines.extend([
-        "    @property",
-        "    def tools(self) -> list[Any]:",
-        '        """Get tools as callable list for AI SDKs."""',
-        "        ...",
-        "",
-        "    def close(self) -> None:",
-        '        """Close server connection."""',
-        "        ...",
-        "",
-    ])
-    
-    return "\n".join(lines)
+    yield _STUB_FOOTER
 
 
 def get_stub_cache_path(command: str) -> Path:
@@ -123,10 +166,7 @@ def get_stub_cache_path(command: str) -> Path:
     """
     # Hash command to create unique filename
     command_hash = hashlib.md5(command.encode()).hexdigest()[:16]
-    cache_dir = Path.home() / ".cache" / "functional-mcp" / "stubs"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    
-    return cache_dir / f"{command_hash}.pyi"
+    return _STUB_DIR / f"{command_hash}.pyi"
 
 
 def save_stub(command: str, content: str) -> Path:
@@ -141,7 +181,7 @@ def save_stub(command: str, content: str) -> Path:
         Path where stub was saved
     """
     path = get_stub_cache_path(command)
-    path.write_text(content)
+    write_bytes(path, content.encode())
     return path
 
 
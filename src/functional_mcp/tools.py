@@ -5,7 +5,29 @@ Handles type conversion, validation, and execution.
 """
 
 from typing import Any, Callable
+from functools import lru_cache
+import base64
 import inspect
+import keyword
+
+from . import _json
+from .exceptions import MCPToolError, MCPValidationError
+
+try:
+    import fastjsonschema as _fastjsonschema
+except ImportError:
+    _fastjsonschema = None
+
+
+# JSON Schema type → parameter annotation
+_PARAM_TYPES = {
+    "string": str,
+    "number": float,
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
 
 
 def create_tool_function(
@@ -28,40 +50,126 @@ def create_tool_function(
     
     # Parse input schema to create function signature
     input_schema = tool.inputSchema or {}
-    properties = input_schema.get("properties", {})
-    required = set(input_schema.get("required", []))
+    schema_json = _json.dumps(input_schema)
+    required = frozenset(input_schema.get("required", ()))
+    check_arguments = _argument_validator(tool.name, schema_json)
     
     # Build function
-    async def tool_fn(**kwargs) -> dict[str, Any]:
+    async def tool_fn(**kwargs) -> Any:
         """Execute MCP tool."""
         # Validate required args
-        missing = required - set(kwargs.keys())
+        missing = required.difference(kwargs)
         if missing:
-            from .exceptions import MCPValidationError
             raise MCPValidationError(
                 tool.name,
-                f"Missing required arguments: {missing}",
+                f"Missing required arguments: {set(missing)}",
                 {"missing": list(missing)}
             )
         
+        # Check argument types before the round-trip
+        if check_arguments is not None:
+            check_arguments(kwargs)
+        
         # Call tool via client
         try:
             result = await client.call_tool(tool.name, kwargs)
-            return result.content
         except Exception as e:
-            from .exceptions import MCPToolError
             raise MCPToolError(tool.name, str(e), e) from e
+        return flatten_content(result.content)
     
     # Set metadata
     tool_fn.__name__ = func_name
     tool_fn.__doc__ = tool.description or f"MCP tool: {tool.name}"
     
-    # Add type hints (basic version)
-    # TODO: Generate full type hints from JSON schema
+    # Computed once here (and shared by tools with the same schema)
+    setattr(tool_fn, "__signature__", _signature_from_schema(schema_json))
     
     return tool_fn
 
 
+@lru_cache(maxsize=256)
+def _compile_validator(schema_json: bytes) -> Callable | None:
+    """
+    Compile an input schema into a validator function.
+    
+    Uses fastjsonschema when it is installed (functional-mcp[speedups]);
+    otherwise, or for schemas it can't compile, returns None and only
+    required arguments are checked. Schema defaults are not filled in,
+    so the server only receives the arguments the caller passed.
+    """
+    if _fastjsonschema is None:
+        return None
+    try:
+        validate: Callable[[Any], Any] = _fastjsonschema.compile(
+            _json.loads(schema_json), use_default=False
+        )
+    except _fastjsonschema.JsonSchemaDefinitionException:
+        return None
+    return validate
+
+
+def _argument_validator(
+    tool_name: str,
+    schema_json: bytes,
+) -> Callable[[dict[str, Any]], None] | None:
+    """
+    Build a local argument check for a tool.
+    
+    The schema is compiled on the first check, so loading a server
+    with many tools doesn't pay for the ones that are never called.
+    
+    Args:
+        tool_name: Tool name for error messages
+        schema_json: JSON of the tool's input schema
+    
+    Returns:
+        Function raising MCPValidationError for invalid arguments, or
+        None if fastjsonschema isn't installed
+    """
+    if _fastjsonschema is None:
+        return None
+    
+    def check_arguments(arguments: dict[str, Any]) -> None:
+        validate = _compile_validator(schema_json)
+        if validate is None:
+            return  # Schema fastjsonschema can't compile
+        try:
+            validate(arguments)
+        except _fastjsonschema.JsonSchemaValueException as e:
+            raise MCPValidationError(tool_name, e.message, {"field": e.name}) from e
+    
+    return check_arguments
+
+
+def flatten_content(content: list[Any]) -> Any:
+    """
+    Unwrap MCP content blocks into plain Python values.
+    
+    Text blocks become str and image/audio blocks their decoded bytes;
+    other blocks (e.g. embedded resources) are kept as they are.
+    
+    Args:
+        content: Content blocks from a tool result
+    
+    Returns:
+        The single value if there is exactly one block, else a list
+    
+    Example:
+        >>> flatten_content([TextContent(type="text", text="sunny")])
+        'sunny'
+    """
+    values = []
+    for block in content:
+        block_type = getattr(block, "type", None)
+        if block_type == "text":
+            values.append(block.text)
+        elif block_type in ("image", "audio"):
+            values.append(base64.b64decode(block.data))
+        else:
+            values.append(block)
+    return values[0] if len(values) == 1 else values
+
+
 def generate_tool_signature(tool: Any) -> inspect.Signature:
     """
     Generate inspect.Signature for a tool from its JSON schema.
@@ -72,26 +180,37 @@ def generate_tool_signature(tool: Any) -> inspect.Signature:
     Returns:
         Python signature object
     """
-    input_schema = tool.inputSchema or {}
+    return _signature_from_schema(_json.dumps(tool.inputSchema or {}))
+
+
+@lru_cache(maxsize=256)
+def _signature_from_schema(schema_json: bytes) -> inspect.Signature:
+    """Build a tool signature, keyed by the JSON of its input schema."""
+    input_schema = _json.loads(schema_json)
     properties = input_schema.get("properties", {})
-    required = set(input_schema.get("required", []))
+    required = frozenset(input_schema.get("required", ()))
+    
+    # Tag each property with its requiredness in one pass
+    fields = [
+        (param_name, param_schema, param_name in required)
+        for param_name, param_schema in properties.items()
+    ]
     
     parameters = []
+    # Names that can't be Python parameters (e.g. "from", "max-results")
+    # are still accepted, through **kwargs
+    accepts_other = False
     
-    for param_name, param_schema in properties.items():
+    for param_name, param_schema, is_required in fields:
+        if not param_name.isidentifier() or keyword.iskeyword(param_name):
+            accepts_other = True
+            continue
+        
         # Determine type
-        param_type = param_schema.get("type", "string")
-        python_type = {
-            "string": str,
-            "number": float,
-            "integer": int,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }.get(param_type, Any)
+        python_type = _PARAM_TYPES.get(param_schema.get("type", "string"), Any)
         
         # Determine default
-        if param_name in required:
+        if is_required:
             default = inspect.Parameter.empty
         else:
             default = param_schema.get("default", None)
@@ -105,7 +224,15 @@ def generate_tool_signature(tool: Any) -> inspect.Signature:
             )
         )
     
-    return inspect.Signature(parameters, return_annotation=dict[str, Any])
+    if accepts_other:
+        var_name = "kwargs"
+        while var_name in properties:
+            var_name = f"_{var_name}"
+        parameters.append(
+            inspect.Parameter(var_name, inspect.Parameter.VAR_KEYWORD, annotation=Any)
+        )
+    
+    return inspect.Signature(parameters, return_annotation=Any)
 
 
-__all__ = ["create_tool_function", "generate_tool_signature"]
+__all__ = ["create_tool_function", "flatten_content", "generate_tool_signature"]
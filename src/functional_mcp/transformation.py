@@ -5,6 +5,7 @@ This module provides tool transformation capabilities inspired by FastMCP,
 allowing you to customize tool schemas and behavior without rewriting tools.
 """
 
+import builtins
 from typing import Any, Callable
 from pydantic import BaseModel
 
@@ -44,7 +45,7 @@ class ArgTransform(BaseModel):
     default_factory: Callable[[], Any] | None = None
     hide: bool = False
     required: bool | None = None
-    type: type | None = None
+    type: builtins.type | None = None
     
     model_config = {
         "arbitrary_types_allowed": True
@@ -52,17 +53,19 @@ class ArgTransform(BaseModel):
     
     def model_post_init(self, __context):
         """Validate transformation rules."""
-        # Can't use default_factory without hiding
-        if self.default_factory and not self.hide:
-            raise ValueError("default_factory requires hide=True")
+        default_factory = self.default_factory
+        if default_factory is not None:
+            # Can't use default_factory without hiding
+            if not self.hide:
+                raise ValueError("default_factory requires hide=True")
+            
+            # Can't have both default and default_factory
+            if self.default is not None:
+                raise ValueError("Cannot specify both default and default_factory")
         
         # Can't hide without a default
-        if self.hide and self.default is None and self.default_factory is None:
+        elif self.hide and self.default is None:
             raise ValueError("hide=True requires default or default_factory")
-        
-        # Can't have both default and default_factory
-        if self.default is not None and self.default_factory is not None:
-            raise ValueError("Cannot specify both default and default_factory")
 
 
 def transform_tool(
@@ -4,13 +4,42 @@ Transport layer wrappers.
 Re-exports FastMCP transports for convenience.
 """
 
-from fastmcp.client.transports import (
-    StdioTransport,
-    StreamableHttpTransport,
-    PythonStdioTransport,
-    NpxStdioTransport,
-    UvxStdioTransport,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Imported on first access (PEP 562) - FastMCP's transports pull in
+# httpx, anyio streams and subprocess machinery
+_LAZY_ATTRS = {
+    "StdioTransport": "fastmcp.client.transports",
+    "StreamableHttpTransport": "fastmcp.client.transports",
+    "PythonStdioTransport": "fastmcp.client.transports",
+    "NpxStdioTransport": "fastmcp.client.transports",
+    "UvxStdioTransport": "fastmcp.client.transports",
+}
+
+if TYPE_CHECKING:
+    from fastmcp.client.transports import (
+        StdioTransport,
+        StreamableHttpTransport,
+        PythonStdioTransport,
+        NpxStdioTransport,
+        UvxStdioTransport,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # Skip __getattr__ on later access
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRS])
+
 
 __all__ = [
     "StdioTransport",
@@ -19,4 +48,3 @@ __all__ = [
     "NpxStdioTransport",
     "UvxStdioTransport",
 ]
-
@@ -0,0 +1,99 @@
+"""
+Shared helpers.
+
+Converts MCP server and tool names into Python identifiers and
+writes the small cache/config files functional-mcp keeps on disk.
+"""
+
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+
+
+_WORD_SEPARATORS = re.compile(r"[-_\s]+")
+_CAMEL_WORD = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+
+# Directories already created by this process
+_READY_DIRS: set[Path] = set()
+
+
+@lru_cache(maxsize=4096)
+def to_snake_case(name: str) -> str:
+    """
+    Convert camelCase to snake_case.
+    
+    Args:
+        name: Name to convert
+    
+    Returns:
+        snake_case name
+    
+    Example:
+        >>> to_snake_case("getWeather")
+        'get_weather'
+    """
+    s1 = _CAMEL_WORD.sub(r"\1_\2", name)
+    return _CAMEL_BOUNDARY.sub(r"\1_\2", s1).lower()
+
+
+@lru_cache(maxsize=1024)
+def to_pascal_case(name: str) -> str:
+    """
+    Convert a name to PascalCase.
+    
+    Words are split on dashes, underscores and whitespace; the rest
+    of each word keeps its case.
+    
+    Args:
+        name: Name to convert
+    
+    Returns:
+        PascalCase name
+    
+    Example:
+        >>> to_pascal_case("weather-server")
+        'WeatherServer'
+        >>> to_pascal_case("Demo Server")
+        'DemoServer'
+    """
+    return "".join(word[:1].upper() + word[1:] for word in _WORD_SEPARATORS.split(name))
+
+
+def ensure_dir(path: Path, force: bool = False) -> None:
+    """
+    Create a directory (and parents) once per process.
+    
+    Args:
+        path: Directory to create
+        force: Create it even if it was created before
+    """
+    if force or path not in _READY_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _READY_DIRS.add(path)
+
+
+def write_bytes(path: Path, data: bytes, mode: int = 0o666) -> None:
+    """
+    Write a file, creating its directory on first use.
+    
+    Args:
+        path: File to write
+        data: File content
+        mode: Permission bits for a newly created file
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    ensure_dir(path.parent)
+    try:
+        fd = os.open(path, flags, mode)
+    except FileNotFoundError:
+        # Directory was removed after we created it
+        ensure_dir(path.parent, force=True)
+        fd = os.open(path, flags, mode)
+    
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+
+
+__all__ = ["to_snake_case", "to_pascal_case", "ensure_dir", "write_bytes"]
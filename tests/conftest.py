@@ -0,0 +1,71 @@
+"""
+Shared pytest configuration.
+
+Tests that spawn real server processes are marked slow and only
+run with --runslow.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run tests that spawn real server processes",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    
+    skip_slow = pytest.mark.skip(reason="use --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def http_server():
+    """URL of a demo MCP server served over HTTP from a background thread."""
+    import socket
+    import threading
+    import time
+    import uvicorn
+    from fastmcp import FastMCP
+    
+    mcp = FastMCP("Demo")
+    
+    @mcp.tool
+    def echo(message: str) -> str:
+        """Echo a message."""
+        return message
+    
+    @mcp.resource("file://readme")
+    def readme() -> str:
+        """Demo readme."""
+        return "hello"
+    
+    sock = socket.create_server(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(mcp.http_app(), log_level="error"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if not thread.is_alive():
+            sock.close()
+            pytest.fail("demo HTTP server exited before starting")
+        if time.monotonic() > deadline:
+            server.should_exit = True
+            sock.close()
+            pytest.fail("demo HTTP server did not start within 10s")
+        time.sleep(0.01)
+    
+    yield f"http://127.0.0.1:{port}/mcp"
+    
+    server.should_exit = True
+    thread.join(5)
+    sock.close()
@@ -15,6 +15,169 @@ def test_load_invalid_command():
         load("invalid-command-that-doesnt-exist")
 
 
+def test_server_stamp_missing_executable():
+    """Test that a missing executable is reported before connecting."""
+    from functional_mcp.loader import _server_stamp
+    
+    with pytest.raises(MCPConnectionError, match="Executable not found"):
+        _server_stamp("invalid-command-that-doesnt-exist --flag")
+    
+    assert _server_stamp("https://example.com/mcp") is None
+
+
+def test_load_servers_invalid_command():
+    """Test that a failing server is reported by name when loading concurrently."""
+    from functional_mcp import load_servers
+    
+    with pytest.raises(MCPConnectionError, match="broken"):
+        load_servers(broken="invalid-command-that-doesnt-exist")
+
+
+def test_load_http(http_server):
+    """Test loading a server over HTTP through the shared connection pool."""
+    with load(http_server, catalog_ttl=None, share=False) as server:
+        assert server.echo(message="hi")[0].text == "hi"
+
+
+@pytest.mark.parametrize(
+    ("command", "expected"),
+    [
+        ("https://example.com/mcp", ("http", "https://example.com/mcp", ())),
+        ("npx -y @scope/server /tmp", ("npx", "@scope/server", ("/tmp",))),
+        ("uvx mcp-server-fetch --verbose", ("stdio", "uvx", ("mcp-server-fetch", "--verbose"))),
+        ("python server.py --port 8000", ("python", "server.py", ("--port", "8000"))),
+        ("python3 -m my_server", ("stdio", "python3", ("-m", "my_server"))),
+        ('python "/opt/my servers/server.py"', ("python", "/opt/my servers/server.py", ())),
+    ],
+)
+def test_parse_command(command, expected):
+    """Test server command classification and splitting."""
+    from functional_mcp.loader import _parse_command
+    
+    spec = _parse_command(command)
+    assert (spec.kind, spec.target, spec.args) == expected
+
+
+@pytest.mark.parametrize("command", ["", "npx -y", 'node "server.js'])
+def test_parse_command_invalid(command):
+    """Test that malformed server commands are rejected."""
+    from functional_mcp.loader import _parse_command
+    
+    with pytest.raises(ValueError):
+        _parse_command(command)
+
+
+def test_load_closes_client_when_build_fails(http_server, monkeypatch):
+    """Test that a server class that can't be built closes its session."""
+    from functional_mcp import loader
+    from functional_mcp.client import MCPClientWrapper
+    
+    closed = []
+    close = MCPClientWrapper.close
+    
+    def record_close(self):
+        closed.append(self)
+        close(self)
+    
+    monkeypatch.setattr(MCPClientWrapper, "close", record_close)
+    
+    def fail(*args):
+        raise ValueError("bad tool")
+    
+    monkeypatch.setattr(loader, "_create_server", fail)
+    
+    with pytest.raises(MCPConnectionError, match="bad tool"):
+        load(http_server, catalog_ttl=None, share=False)
+    assert len(closed) == 1
+
+
+def test_load_from_cached_catalog(http_server, tmp_path, monkeypatch):
+    """Test that a cached catalog is served without connecting, then refreshed on use."""
+    from functional_mcp import catalog
+    
+    monkeypatch.setattr(catalog, "_CATALOG_DIR", tmp_path)
+    
+    with load(http_server, share=False) as server:
+        assert server._client.client.is_connected()
+    assert catalog.load_catalog(http_server, ttl=60)["server_info"].name == "Demo"
+    
+    with load(http_server, share=False) as server:
+        assert not server._client.client.is_connected()
+        assert server.echo(message="hi")[0].text == "hi"
+
+
+@pytest.fixture
+def closed_wrappers(monkeypatch):
+    """Wrappers released with aclose(), recorded in order."""
+    from functional_mcp.client import MCPClientWrapper
+    
+    closed = []
+    aclose = MCPClientWrapper.aclose
+    
+    async def record_aclose(self):
+        closed.append(self)
+        await aclose(self)
+    
+    monkeypatch.setattr(MCPClientWrapper, "aclose", record_aclose)
+    return closed
+
+
+async def test_aload_servers_failure_closes_clients(
+    http_server, tmp_path, monkeypatch, closed_wrappers
+):
+    """Test that a failed concurrent load closes every started client."""
+    from functional_mcp import aload_servers, catalog
+    
+    monkeypatch.setattr(catalog, "_CATALOG_DIR", tmp_path)
+    
+    with pytest.raises(MCPConnectionError, match="broken"):
+        await aload_servers(good=http_server, broken="invalid-command-that-doesnt-exist")
+    
+    assert len(closed_wrappers) == 2
+    assert all(wrapper._closed for wrapper in closed_wrappers)
+    assert not any(wrapper.client.is_connected() for wrapper in closed_wrappers)
+
+
+async def test_aload_servers_cancel_closes_clients(closed_wrappers):
+    """Test that cancelling a concurrent load closes the clients it started."""
+    import asyncio
+    import sys
+    from functional_mcp import aload_servers
+    
+    # Never answers the MCP handshake
+    hanging = f'{sys.executable} -c "import time; time.sleep(30)"'
+    task = asyncio.ensure_future(aload_servers(hanging=hanging))
+    await asyncio.sleep(0.3)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    
+    assert len(closed_wrappers) == 1
+    assert closed_wrappers[0]._closed
+
+
+def test_shared_load(http_server):
+    """Test that loads with the same settings share one reference-counted client."""
+    first = load(http_server, catalog_ttl=None)
+    second = load(http_server, catalog_ttl=None)
+    other = load(http_server, catalog_ttl=None, headers={"X-Tenant": "b"})
+    try:
+        assert second._client is first._client
+        assert other._client is not first._client
+        
+        # Closing one handle (even twice) leaves the other usable
+        first.close()
+        first.close()
+        assert second.echo(message="still open")[0].text == "still open"
+    finally:
+        second.close()
+        other.close()
+    
+    assert first._client._closed
+    with load(http_server, catalog_ttl=None) as third:
+        assert third._client is not first._client
+
+
 def test_registry():
     """Test server registration."""
     register(test_server="npx test-server")
@@ -25,6 +188,73 @@ def test_registry():
     assert get_server_command("test_server") == "npx test-server"
 
 
+def test_oauth_token_cache(tmp_path, monkeypatch):
+    """Test that OAuth tokens are cached per provider, client and scopes."""
+    import os
+    from functional_mcp import auth
+    
+    monkeypatch.setattr(auth, "_TOKEN_CACHE", tmp_path / "tokens.json")
+    monkeypatch.setattr(auth, "_token_memo", None)
+    
+    def oauth(client_id="app", scopes=("read", "write")):
+        return auth.OAuth(
+            "https://idp.example/auth", "https://idp.example/token", client_id, list(scopes)
+        )
+    
+    oauth()._save_token({"access_token": "t1", "expires_in": 3600})
+    assert os.stat(auth._TOKEN_CACHE).st_mode & 0o777 == 0o600
+    
+    # Re-read from disk; scope order doesn't matter
+    monkeypatch.setattr(auth, "_token_memo", None)
+    cached = oauth(scopes=("write", "read"))
+    assert cached._load_cached_token()
+    assert cached._token == "t1"
+    
+    assert not oauth(client_id="other")._load_cached_token()
+    assert not oauth(scopes=("read",))._load_cached_token()
+    
+    # Tokens within the expiry margin count as expired
+    oauth()._save_token({"access_token": "t2", "expires_in": 30})
+    assert not oauth()._load_cached_token()
+
+
+def test_oauth_token_cache_upgrades_old_file(tmp_path, monkeypatch):
+    """Test that a flat old-format token file is cleaned up and made private."""
+    import os
+    from functional_mcp import _json, auth
+    
+    monkeypatch.setattr(auth, "_TOKEN_CACHE", tmp_path / "tokens.json")
+    monkeypatch.setattr(auth, "_token_memo", None)
+    auth._TOKEN_CACHE.write_text('{"access_token": "old", "token_type": "bearer"}')
+    os.chmod(auth._TOKEN_CACHE, 0o644)
+    
+    oauth = auth.OAuth("https://idp.example/auth", "https://idp.example/token", "app")
+    oauth._save_token({"access_token": "new"})
+    
+    assert list(_json.loads(auth._TOKEN_CACHE.read_bytes())) == [oauth._cache_key]
+    assert os.stat(auth._TOKEN_CACHE).st_mode & 0o777 == 0o600
+
+
+def test_registry_reloads_on_change(tmp_path, monkeypatch):
+    """Test that the registry is re-read when the file changes on disk."""
+    import os
+    from functional_mcp import registry
+    
+    monkeypatch.setattr(registry, "_REGISTRY_PATH", tmp_path / "servers.json")
+    monkeypatch.setattr(registry, "_registry", {})
+    monkeypatch.setattr(registry, "_registry_stamp", None)
+    
+    registry.register(weather="npx weather-server")
+    assert registry.get_server_command("weather") == "npx weather-server"
+    
+    # Another process rewrites the file
+    registry._REGISTRY_PATH.write_text('{"weather": "uvx weather", "fs": "npx fs"}')
+    stat = registry._REGISTRY_PATH.stat()
+    os.utime(registry._REGISTRY_PATH, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    
+    assert registry.list_servers() == {"weather": "uvx weather", "fs": "npx fs"}
+
+
 def test_arg_transform():
     """Test ArgTransform validation."""
     from functional_mcp import ArgTransform
@@ -66,7 +296,22 @@ def test_tool_transformation():
     assert transformed.__name__ in ["add_to_ten", "original_tool"]  # TODO: fix after implementation
 
 
-@pytest.mark.asyncio
+async def test_async_load_http(http_server):
+    """Test async loading and calling without blocking the event loop."""
+    from functional_mcp import aload
+    
+    server = await aload(http_server, catalog_ttl=None, share=False)
+    try:
+        result = await server.echo.acall(message="hi")
+        assert result[0].text == "hi"
+    finally:
+        server.close()
+    
+    with pytest.raises(MCPConnectionError):
+        await aload("invalid-command-that-doesnt-exist")
+
+
+@pytest.mark.slow
 async def test_async_load():
     """Test async loading."""
     from functional_mcp import aload
@@ -77,31 +322,243 @@ async def test_async_load():
         server = await aload("npx test-server")
 
 
+def test_static_resource_cache(monkeypatch):
+    """Test that static resources are cached per TTL and returned as copies."""
+    from mcp import types
+    from functional_mcp import server as server_module
+    
+    class FakeClient:
+        reads = 0
+        
+        def read_resource(self, uri):
+            self.reads += 1
+            return [types.TextResourceContents(uri=uri, text="hello")]
+    
+    client = FakeClient()
+    resource = types.Resource(uri="file://readme", name="readme")
+    server = server_module.create_server_class(
+        "Demo", [], [resource], [], client, None, None
+    )()
+    
+    first = server.README
+    first.clear()
+    assert server.README[0].text == "hello"
+    assert client.reads == 1
+    
+    server.invalidate_resource("file://readme")
+    server.README
+    assert client.reads == 2
+    
+    # Expired contents are re-read
+    monkeypatch.setattr(server_module, "_RESOURCE_TTL", 0.0)
+    server.invalidate_resource()
+    server.README
+    server.README
+    assert client.reads == 4
+
+
+def test_tool_method_signature():
+    """Test that generated tool methods carry their schema's signature."""
+    import inspect
+    from mcp import types
+    from functional_mcp.server import create_server_class
+    
+    tool = types.Tool(
+        name="getWeather",
+        inputSchema={
+            "type": "object",
+            "properties": {"city": {"type": "string"}, "days": {"type": "integer"}},
+            "required": ["city"],
+        },
+    )
+    server = create_server_class("Demo", [tool], [], [], None, None, None)()
+    
+    for fn in (server.get_weather, server.get_weather.acall):
+        params = inspect.signature(fn).parameters
+        assert list(params) == ["city", "days"]
+        assert params["city"].annotation is str
+        assert params["days"].default is None
+
+
+def test_tool_method_signature_non_identifier_names():
+    """Test that schema names that can't be parameters go through **kwargs."""
+    import inspect
+    from mcp import types
+    from functional_mcp.server import create_server_class
+    
+    class FakeClient:
+        def call_tool(self, name, arguments):
+            text = types.TextContent(type="text", text=str(arguments))
+            return types.CallToolResult(content=[text])
+    
+    tool = types.Tool(
+        name="search",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string"},
+                "from": {"type": "string"},
+                "max-results": {"type": "integer"},
+            },
+        },
+    )
+    server = create_server_class("Demo", [tool], [], [], FakeClient(), None, None)()
+    
+    params = inspect.signature(server.search).parameters
+    assert list(params) == ["query", "kwargs"]
+    assert params["kwargs"].kind is inspect.Parameter.VAR_KEYWORD
+    
+    result = server.search(query="q", **{"from": "a", "max-results": 3})
+    assert result[0].text == str({"query": "q", "from": "a", "max-results": 3})
+
+
+def test_argument_validation_leaves_kwargs_unchanged():
+    """Test that checking arguments doesn't fill in schema defaults."""
+    from functional_mcp import _json
+    from functional_mcp.exceptions import MCPValidationError
+    from functional_mcp.tools import _argument_validator
+    
+    pytest.importorskip("fastjsonschema")
+    
+    schema = {
+        "type": "object",
+        "properties": {
+            "city": {"type": "string"},
+            "days": {"type": "integer", "default": 1},
+            "unit": {"type": "string", "default": "C"},
+        },
+        "required": ["city"],
+    }
+    check_arguments = _argument_validator("forecast", _json.dumps(schema))
+    
+    kwargs = {"city": "Paris"}
+    check_arguments(kwargs)
+    assert kwargs == {"city": "Paris"}
+    
+    with pytest.raises(MCPValidationError):
+        check_arguments({"city": "Paris", "days": "two"})
+
+
+# (schema, expected type) pairs; checked in one loop rather than
+# parametrized, which gets slow to collect as the table grows
+SCHEMA_CASES = (
+    ({"type": "string"}, str),
+    ({"type": "integer"}, int),
+    ({"type": "boolean"}, bool),
+    ({"type": "number"}, float),
+    ({"type": "null"}, type(None)),
+)
+
+
 def test_schema_conversion():
     """Test JSON Schema → Python type conversion."""
     from functional_mcp.schema import json_schema_to_python_type
     
-    assert json_schema_to_python_type({"type": "string"}) == str
-    assert json_schema_to_python_type({"type": "integer"}) == int
-    assert json_schema_to_python_type({"type": "boolean"}) == bool
+    for schema, expected in SCHEMA_CASES:
+        assert json_schema_to_python_type(schema) == expected, schema
     
     # TODO: Test complex types after implementation
 
 
 def test_snake_case_conversion():
     """Test camelCase → snake_case conversion."""
-    # TODO: Extract to utility and test
-    import re
-    
-    def to_snake_case(name: str) -> str:
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    from functional_mcp.utils import to_snake_case
     
     assert to_snake_case("getWeather") == "get_weather"
     assert to_snake_case("searchFiles") == "search_files"
     assert to_snake_case("simpleword") == "simpleword"
 
 
+def test_pascal_case_conversion():
+    """Test server name → PascalCase class name conversion."""
+    from functional_mcp.utils import to_pascal_case
+    
+    assert to_pascal_case("Demo Server") == "DemoServer"
+    assert to_pascal_case("weather-server") == "WeatherServer"
+    assert to_pascal_case("my_mcp_tool") == "MyMcpTool"
+    assert to_pascal_case("getWeather") == "GetWeather"
+
+
+def test_catalog_roundtrip(tmp_path, monkeypatch):
+    """Test that cached catalogs round-trip and respect the TTL."""
+    from mcp import types
+    from functional_mcp import catalog
+    
+    monkeypatch.setattr(catalog, "_CATALOG_DIR", tmp_path)
+    
+    capabilities = {
+        "server_info": types.Implementation(name="Demo", version="1.0"),
+        "tools": [types.Tool(name="echo", inputSchema={"type": "object"})],
+        "resources": [],
+        "prompts": [types.Prompt(name="greet")],
+    }
+    catalog.save_catalog("demo-server", capabilities)
+    
+    cached = catalog.load_catalog("demo-server", ttl=60)
+    assert cached["server_info"].name == "Demo"
+    assert cached["tools"][0].name == "echo"
+    assert cached["prompts"][0].name == "greet"
+    
+    assert catalog.load_catalog("other-server", ttl=60) is None
+    assert catalog.load_catalog("demo-server", ttl=-1) is None
+    
+    catalog.clear_catalog("demo-server")
+    assert catalog.load_catalog("demo-server", ttl=60) is None
+
+
+def test_catalog_keyed_by_headers(tmp_path, monkeypatch):
+    """Test that a catalog cached under one set of headers isn't served to another."""
+    from mcp import types
+    from functional_mcp import catalog
+    
+    monkeypatch.setattr(catalog, "_CATALOG_DIR", tmp_path)
+    
+    capabilities = {
+        "server_info": types.Implementation(name="Demo", version="1.0"),
+        "tools": [types.Tool(name="admin_only", inputSchema={"type": "object"})],
+        "resources": [],
+        "prompts": [],
+    }
+    url = "https://example.com/mcp"
+    alice = {"Authorization": "Bearer alice", "X-Tenant": "a"}
+    catalog.save_catalog(url, capabilities, headers=alice)
+    
+    # Header order doesn't matter
+    reordered = dict(reversed(list(alice.items())))
+    assert catalog.load_catalog(url, ttl=60, headers=reordered) is not None
+    
+    assert catalog.load_catalog(url, ttl=60) is None
+    assert catalog.load_catalog(url, ttl=60, headers={"Authorization": "Bearer bob"}) is None
+    
+    # Credentials are never written to disk
+    for path in tmp_path.iterdir():
+        assert b"alice" not in path.read_bytes()
+
+
+def test_stub_streaming():
+    """Test that a stub written to a stream matches the returned one."""
+    import io
+    from mcp import types
+    from functional_mcp.stubs import generate_stub
+    
+    tools = [
+        types.Tool(
+            name="getWeather",
+            description="Get weather",
+            inputSchema={"type": "object", "properties": {"city": {"type": "string"}}},
+        ),
+    ]
+    prompts = [types.Prompt(name="greet")]
+    
+    content = generate_stub("Demo Server", tools, [], prompts)
+    assert "class DemoServerServer:" in content
+    assert "def get_weather(self, city: str)" in content
+    
+    out = io.StringIO()
+    assert generate_stub("Demo Server", tools, [], prompts, out=out) is None
+    assert out.getvalue() == content
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 